@@ -4,38 +4,168 @@ Data is loaded from JSON files in the data/ folder
 Edit JSON files to update events, members, and other details
 """
 
+import functools
 import json
+import logging
+import mmap
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib parser if orjson is unavailable
+    orjson = None
+
+logger = logging.getLogger(__name__)
 
 # Get the directory of this file
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(BASE_DIR, 'data')
 
+# Error raised by the active parser (orjson.JSONDecodeError subclasses ValueError)
+JSONDecodeError = orjson.JSONDecodeError if orjson else json.JSONDecodeError
+
+def json_loads(data):
+    """Parse JSON from bytes/str using orjson when available"""
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def json_dumps(obj, indent=True):
+    """Serialize to UTF-8 JSON bytes using orjson when available
+
+    indent=False gives compact single-line output (for JSONL records).
+    """
+    if orjson:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    if indent:
+        return json.dumps(obj, indent=4, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def _read_json_file(filepath):
+    """Parse a JSON file, mapping it into memory instead of copying it into a buffer"""
+    with open(filepath, 'rb') as f:
+        if hasattr(os, 'posix_fadvise'):
+            # Ask the kernel to start readahead before parsing begins (Linux only)
+            try:
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+            except OSError:
+                pass
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files (and some filesystems) cannot be mapped
+            return json_loads(f.read())
+        try:
+            if not orjson:
+                return json.loads(mm[:])
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+        finally:
+            mm.close()
+
+# Full paths of the known data files, resolved once
+_PATHS = {name: os.path.join(DATA_DIR, name)
+          for name in ('club_info.json', 'events.json', 'members.json', 'gallery.json')}
+
+# Parsed files keyed by path -> ((st_mtime_ns, st_size), data)
+_parsed_cache = {}
+
 def load_json(filename):
-    """Load JSON data from the data directory"""
-    filepath = os.path.join(DATA_DIR, filename)
+    """Load JSON data from the data directory
+
+    Parsed results are memoized by file mtime and size, so repeated loads of
+    an unchanged file skip parsing. The returned object is shared between
+    callers and must be treated as read-only.
+    """
+    filepath = _PATHS.get(filename) or os.path.join(DATA_DIR, filename)
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        st = os.stat(filepath)
+        key = (st.st_mtime_ns, st.st_size)
+        cached = _parsed_cache.get(filepath)
+        if cached and cached[0] == key:
+            return cached[1]
+        # Parse raw bytes: orjson reads UTF-8 directly, skipping the text decode step
+        data = _read_json_file(filepath)
+        _parsed_cache[filepath] = (key, data)
+        return data
     except FileNotFoundError:
-        print(f"Warning: {filename} not found. Using empty data.")
+        logger.warning("%s not found. Using empty data.", filename)
         return {} if 'info' in filename else []
-    except json.JSONDecodeError as e:
-        print(f"Error parsing {filename}: {e}")
+    except JSONDecodeError as e:
+        logger.error("Error parsing %s: %s", filename, e)
         return {} if 'info' in filename else []
 
-# Email validation settings
-ALLOWED_EMAIL_DOMAINS = [
+def load_json_projected(filename, keep_keys):
+    """Load a data file keeping only the given keys
+
+    For object files the top-level keys are filtered; for list files each
+    object entry is reduced to the given keys.
+    """
+    data = load_json(filename)
+    if isinstance(data, dict):
+        return {k: data[k] for k in keep_keys if k in data}
+    return [{k: item[k] for k in keep_keys if k in item} if isinstance(item, dict) else item
+            for item in data]
+
+# Email validation settings (frozenset for O(1) membership checks;
+# use sorted() when displaying the list to users)
+ALLOWED_EMAIL_DOMAINS = frozenset({
     'kongu.edu',
     'kongu.ac.in',
     'gmail.com'
-]
+})
+
+# Display form of the allowed domains for error messages
+ALLOWED_EMAIL_DOMAINS_TEXT = ', '.join(sorted(ALLOWED_EMAIL_DOMAINS))
+
+# Single compiled matcher for the allowed domains, anchored at the end of the address
+_ALLOWED_EMAIL_RE = re.compile(
+    r'@(?:' + '|'.join(re.escape(d) for d in sorted(ALLOWED_EMAIL_DOMAINS)) + r')\Z',
+    re.IGNORECASE
+)
+
+def is_allowed_email(email):
+    """Return True if the email address belongs to an allowed domain"""
+    return _ALLOWED_EMAIL_RE.search(email) is not None
 
 # Note: Razorpay and Groq API keys are now stored in data/club_info.json
-# and can be edited via the Admin Panel > Club Information
+# and can be edited via the Admin Panel > Club Information.
+# In production, set RAZORPAY_KEY_ID / RAZORPAY_KEY_SECRET environment
+# variables instead so the secrets stay out of the data files.
+@functools.lru_cache(maxsize=1)
+def razorpay_keys():
+    """Razorpay (key_id, key_secret) from the environment, read on first use"""
+    return os.environ.get('RAZORPAY_KEY_ID', ''), os.environ.get('RAZORPAY_KEY_SECRET', '')
+
+@functools.lru_cache(maxsize=1)
+def razorpay_webhook_secret():
+    """RAZORPAY_WEBHOOK_SECRET from the environment, read on first use"""
+    return os.environ.get('RAZORPAY_WEBHOOK_SECRET', '')
+
+# Data files exposed as module attributes (CLUB_INFO, EVENTS, ...).
+# They are loaded lazily on first access via __getattr__ (PEP 562),
+# so importing config for e.g. ALLOWED_EMAIL_DOMAINS parses nothing, and
+# follow edits to the files through load_json()'s mtime/size cache.
+# Like load_json() results, the objects are shared: treat them as read-only.
+_DATA_FILES = {
+    'CLUB_INFO': 'club_info.json',
+    'EVENTS': 'events.json',
+    'MEMBERS': 'members.json',
+    'GALLERY': 'gallery.json',
+}
+
+def __getattr__(name):
+    """Load data attributes from JSON on access"""
+    if name in _DATA_FILES:
+        return load_json(_DATA_FILES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Load all data from JSON files
-CLUB_INFO = load_json('club_info.json')
-EVENTS = load_json('events.json')
-MEMBERS = load_json('members.json')
-GALLERY = load_json('gallery.json')
+def preload():
+    """Load all data attributes at once, reading the files concurrently"""
+    names = list(_DATA_FILES)
+    with ThreadPoolExecutor(max_workers=len(names)) as executor:
+        list(executor.map(load_json, [_DATA_FILES[name] for name in names]))
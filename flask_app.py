@@ -1,7 +1,10 @@
-from flask import Flask, render_template, jsonify, request, session, redirect, url_for, flash
+from flask import Flask, render_template, jsonify, request, session, redirect, url_for, flash, g
 from flask_cors import CORS
-from functools import wraps
-from datetime import datetime, timezone, timedelta
+from functools import wraps, lru_cache
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict, deque, namedtuple
+from datetime import date, datetime, timezone, timedelta
 from werkzeug.utils import secure_filename
 
 # IST Timezone (UTC+5:30)
@@ -10,142 +13,360 @@ IST = timezone(timedelta(hours=5, minutes=30))
 def get_ist_now():
     """Get current datetime in IST"""
     return datetime.now(IST)
+
+def get_ist_today():
+    """Today's date in IST, computed once per request"""
+    if 'ist_today' not in g:
+        g.ist_today = get_ist_now().date()
+    return g.ist_today
 import os
 import json
 import time
 import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlencode
 import base64
 import uuid
 import qrcode
+from qrcode.image.pil import PilImage
+try:
+    import segno
+except ImportError:  # Fall back to qrcode + PIL if segno is unavailable
+    segno = None
 import threading
+import itertools
+import atexit
 import tempfile
 import shutil
 import hmac
+import smtplib
 import hashlib
 import logging
-import io
 from html import escape as html_escape
 from io import BytesIO
+from flask.json.provider import DefaultJSONProvider
+from jinja2 import FileSystemBytecodeCache
 from flask_mail import Mail, Message
-from config import ALLOWED_EMAIL_DOMAINS
+try:
+    import orjson
+except ImportError:  # Fall back to Flask's stdlib JSON provider if orjson is unavailable
+    orjson = None
+try:
+    from flask_compress import Compress
+except ImportError:  # Responses are sent uncompressed without flask-compress
+    Compress = None
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; startup setup runs unlocked there
+    fcntl = None
+from config import (ALLOWED_EMAIL_DOMAINS_TEXT, BASE_DIR, JSONDecodeError, is_allowed_email, json_dumps,
+                    json_loads, razorpay_keys, razorpay_webhook_secret, load_json_projected)
 
 # API keys are now loaded from club_info.json (editable in admin panel)
 # These are helper functions to get current API config
+@lru_cache(maxsize=1)
+def _api_config_cached(version):
+    return load_json_projected('club_info.json', ('api_config',)).get('api_config', {})
+
+def _api_config_version():
+    """Change marker for club_info.json; admin saves bump its mtime"""
+    try:
+        st = os.stat(os.path.join(BASE_DIR, 'data', 'club_info.json'))
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
 def get_api_config():
     """Get API configuration from club_info.json"""
-    club_info, _, _, _ = load_data()
-    return club_info.get('api_config', {})
+    return _api_config_cached(_api_config_version())
 
-def get_groq_api_key():
-    return get_api_config().get('GROQ_API_KEY', '')
+def get_groq_api_key(config=None):
+    return (config or get_api_config()).get('GROQ_API_KEY', '')
 
-def get_groq_model():
-    return get_api_config().get('GROQ_MODEL', 'llama-3.1-8b-instant')
+def get_groq_model(config=None):
+    return (config or get_api_config()).get('GROQ_MODEL', 'llama-3.1-8b-instant')
 
 def get_razorpay_keys():
+    # Environment variables take precedence over the admin-editable club_info.json
+    env_key_id, env_key_secret = razorpay_keys()
+    if env_key_id and env_key_secret:
+        return env_key_id, env_key_secret
     config = get_api_config()
     return config.get('RAZORPAY_KEY_ID', ''), config.get('RAZORPAY_KEY_SECRET', '')
 
-# Cached events context for chatbot (updated when events change)
-_events_context_cache = None
+@lru_cache(maxsize=8)
+def _hmac_template(secret):
+    """Keyed HMAC-SHA256 with its pads already absorbed; .copy() it per message"""
+    return hmac.new(secret.encode(), digestmod=hashlib.sha256)
+
+def verify_razorpay_signature(payload, signature, secret):
+    """Check a Razorpay HMAC-SHA256 hex signature in constant time
+
+    payload is the signed str/bytes. An empty secret never verifies.
+    """
+    if not secret or not isinstance(signature, str) or len(signature) != 64:
+        return False
+    try:
+        received = bytes.fromhex(signature)
+    except ValueError:
+        return False
+    if isinstance(payload, str):
+        payload = payload.encode()
+    mac = _hmac_template(secret).copy()
+    mac.update(payload)
+    return hmac.compare_digest(mac.digest(), received)
+
+# Razorpay retries webhooks with identical bodies: (secret, signature) -> body
+# fingerprint of deliveries that already verified, most recent last
+_verified_webhooks = OrderedDict()
+_verified_webhooks_lock = threading.Lock()
+_VERIFIED_WEBHOOKS_MAX = 512
+
+def verify_webhook_signature(body, signature, secret):
+    """verify_razorpay_signature for webhook bodies, skipping the HMAC on retries"""
+    if not secret or not isinstance(signature, str):
+        return False
+    key = (secret, signature)
+    fingerprint = hashlib.blake2b(body, digest_size=16).digest()
+    with _verified_webhooks_lock:
+        if _verified_webhooks.get(key) == fingerprint:
+            _verified_webhooks.move_to_end(key)
+            return True
+    if not verify_razorpay_signature(body, signature, secret):
+        return False
+    with _verified_webhooks_lock:
+        _verified_webhooks[key] = fingerprint
+        if len(_verified_webhooks) > _VERIFIED_WEBHOOKS_MAX:
+            _verified_webhooks.popitem(last=False)
+    return True
+
+# Derived views of the events list, rebuilt only when the list changes:
+# (events_list, sorted_visible, top3, deadline_events, context_str,
+#  events_by_id, events_by_slug)
+_events_cache = None
+
+def _event_sort_key(event):
+    return (
+        not bool(event.get('register_link')),  # Events with register_link first
+        event.get('status') != 'upcoming',     # Then upcoming events
+        event.get('status') == 'completed'     # Then completed
+    )
+
+def _parse_deadline(value):
+    """Parse a registration deadline in either supported format, or None"""
+    if not isinstance(value, str):
+        return None
+    # ISO dates are the common case; fromisoformat is much cheaper than strptime
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.strptime(value, '%B %d, %Y').date()
+    except ValueError:
+        return None
 
 def update_events_context_cache(events_list=None):
-    """Update the cached events context string for chatbot"""
-    global _events_context_cache
+    """Rebuild the cached sorted event lists, deadlines and chatbot context"""
+    global _events_cache
     if events_list is None:
         events_list, _ = load_events_file()
-    _events_context_cache = "\n".join([
+    
+    # Filter out hidden events, then sort
+    visible_events = [e for e in events_list if e.get('show_in_events', True)]
+    sorted_visible = sorted(visible_events, key=_event_sort_key)
+    
+    # Upcoming events with an open registration link, by earliest deadline
+    deadline_events = []
+    for event in visible_events:
+        registration_deadline = event.get('registration_deadline')
+        if event.get('status') == 'upcoming' and isinstance(registration_deadline, dict) and event.get('register_link'):
+            deadline = _parse_deadline(registration_deadline.get('date'))
+            if deadline:
+                deadline_events.append((deadline, event))
+    deadline_events.sort(key=lambda x: x[0])
+    
+    context_str = "\n".join([
         f"- {e.get('name')}: {e.get('description', 'No description')} | Date: {e.get('date')} | Status: {e.get('status')} | Location: {e.get('location')}"
         for e in events_list
     ])
-    return _events_context_cache
+    # Lookup indexes; the first event wins on a duplicate id/slug, like a linear scan
+    events_by_id = {}
+    events_by_slug = {}
+    for event in events_list:
+        events_by_id.setdefault(event.get('id'), event)
+        events_by_slug.setdefault(slugify(event.get('name', '')), event)
+    
+    _events_cache = (events_list, sorted_visible, sorted_visible[:3], deadline_events, context_str,
+                     events_by_id, events_by_slug)
+    return _events_cache
+
+def get_events_cache(events_list=None):
+    """Get the derived events views, rebuilding them if the list changed"""
+    cache = _events_cache
+    if cache is None or (events_list is not None and cache[0] is not events_list):
+        cache = update_events_context_cache(events_list)
+    return cache
+
+def get_event_by_id(events_list, event_id):
+    """Find an event by id using the cached index"""
+    return get_events_cache(events_list)[5].get(event_id)
+
+def get_event_by_slug(events_list, event_slug):
+    """Find an event by the slug of its name using the cached index"""
+    return get_events_cache(events_list)[6].get(event_slug)
 
 def get_events_context():
     """Get cached events context, building it if needed"""
-    global _events_context_cache
-    if _events_context_cache is None:
-        update_events_context_cache()
-    return _events_context_cache
+    return get_events_cache()[4]
 
 # Configure logging instead of print statements
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Thread lock for file operations to prevent race conditions
+# Shared HTTP session for Groq/Razorpay calls so TLS connections are reused
+HTTP = requests.Session()
+HTTP.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=Retry(total=2, backoff_factor=0.1, status_forcelist=[502, 503, 504])
+))
+
+# (connect, read) timeouts: give up quickly on an unreachable host so a worker
+# thread isn't pinned, while still allowing slow LLM completions
+GROQ_TIMEOUT = (5, 30)
+RAZORPAY_TIMEOUT = (3, 10)
+
+# Reader-writer locks for file operations to prevent race conditions
 _file_locks = {}
 _file_locks_lock = threading.Lock()
 _MAX_FILE_LOCKS = 100  # Prevent unbounded memory growth
 
-def get_file_lock(filepath):
-    """Get or create a lock for a specific file"""
+class RWLock:
+    """Many concurrent readers or a single writer (writers are preferred)"""
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self.readers = 0
+        self.writer = False
+        self.writers_waiting = 0
+
+    def acquire_read(self):
+        with self._cond:
+            while self.writer or self.writers_waiting:
+                self._cond.wait()
+            self.readers += 1
+
+    def release_read(self):
+        with self._cond:
+            self.readers -= 1
+            if not self.readers:
+                self._cond.notify_all()
+
+    def acquire_write(self):
+        with self._cond:
+            self.writers_waiting += 1
+            while self.writer or self.readers:
+                self._cond.wait()
+            self.writers_waiting -= 1
+            self.writer = True
+
+    def release_write(self):
+        with self._cond:
+            self.writer = False
+            self._cond.notify_all()
+
+    def in_use(self):
+        return self.readers or self.writer or self.writers_waiting
+
+    @contextmanager
+    def read(self):
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self):
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+def get_file_rwlock(filepath):
+    """Get or create a reader-writer lock for a specific file"""
     with _file_locks_lock:
-        if filepath not in _file_locks:
-            # Clean up old locks if we have too many (simple LRU-style cleanup)
+        lock = _file_locks.get(filepath)
+        if lock is None:
+            # Clean up old locks if we have too many, skipping any in use
             if len(_file_locks) >= _MAX_FILE_LOCKS:
-                # Remove locks that aren't currently held
-                to_remove = []
-                for path, lock in list(_file_locks.items()):
-                    if not lock.locked():
-                        to_remove.append(path)
-                        if len(_file_locks) - len(to_remove) < _MAX_FILE_LOCKS // 2:
-                            break
-                for path in to_remove:
+                idle = [path for path, l in _file_locks.items() if not l.in_use()]
+                for path in idle[:len(_file_locks) - _MAX_FILE_LOCKS // 2]:
                     del _file_locks[path]
-            _file_locks[filepath] = threading.Lock()
-        return _file_locks[filepath]
+            lock = _file_locks[filepath] = RWLock()
+        return lock
 
 def safe_json_read(filepath):
-    """Safely read JSON file with locking"""
-    lock = get_file_lock(filepath)
-    with lock:
+    """Safely read JSON file with locking (concurrent readers allowed)"""
+    with get_file_rwlock(filepath).read():
         if not os.path.exists(filepath):
             return []
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError) as e:
+            with open(filepath, 'rb') as f:
+                return json_loads(f.read())
+        except (JSONDecodeError, IOError) as e:
             logger.error(f"Failed to read JSON from {filepath}: {e}")
             # Try to recover from backup if exists
             backup_path = filepath + '.backup'
             if os.path.exists(backup_path):
                 logger.info(f"Attempting to recover from backup: {backup_path}")
                 try:
-                    with open(backup_path, 'r', encoding='utf-8') as f:
-                        return json.load(f)
+                    with open(backup_path, 'rb') as f:
+                        return json_loads(f.read())
                 except:
                     pass
             return []
 
 def _write_json_no_lock(filepath, data):
     """Internal: Write JSON without acquiring lock (caller must hold lock)"""
+    return _write_bytes_no_lock(filepath, json_dumps(data))
+
+def _write_bytes_no_lock(filepath, payload):
+    """Internal: Atomically replace filepath with payload, keeping a backup (caller must hold lock)"""
     os.makedirs(os.path.dirname(filepath), exist_ok=True)
     
-    # Create backup of existing file
+    # Keep the previous version as a backup. A hardlink costs no copy: the
+    # old inode stays reachable once the temp file replaces filepath below.
     if os.path.exists(filepath):
         backup_path = filepath + '.backup'
         try:
-            shutil.copy2(filepath, backup_path)
-        except Exception as e:
-            logger.warning(f"Could not create backup: {e}")
+            try:
+                os.unlink(backup_path)
+            except FileNotFoundError:
+                pass
+            os.link(filepath, backup_path)
+        except OSError:
+            # Filesystem without hardlink support
+            try:
+                shutil.copy2(filepath, backup_path)
+            except Exception as e:
+                logger.warning(f"Could not create backup: {e}")
     
     # Write to temp file first, then atomic rename
     dir_name = os.path.dirname(filepath)
     fd, temp_path = tempfile.mkstemp(suffix='.json', dir=dir_name)
     try:
-        with os.fdopen(fd, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
         
-        # Atomic rename/replace
-        if os.name == 'nt':
-            if os.path.exists(filepath):
-                os.replace(temp_path, filepath)
-            else:
-                os.rename(temp_path, filepath)
-        else:
-            os.rename(temp_path, filepath)
+        # Atomic replace (on both POSIX and Windows)
+        os.replace(temp_path, filepath)
         
-        logger.debug(f"Successfully wrote JSON to {filepath}")
+        logger.debug(f"Successfully wrote {filepath}")
         return True
     except Exception as e:
         if os.path.exists(temp_path):
@@ -157,60 +378,304 @@ def safe_json_write(filepath, data):
     Safely write JSON file with atomic write and backup.
     Uses a temp file + rename approach to prevent corruption.
     """
-    lock = get_file_lock(filepath)
-    with lock:
+    with get_file_rwlock(filepath).write():
         return _write_json_no_lock(filepath, data)
 
+# Registration files hold one JSON object per line (JSONL) so a new signup
+# is a single append instead of a full rewrite. Files from before this format
+# hold a JSON array; they are still read, and rewritten as JSONL on the next
+# full write or the next append.
+
+def _parse_registrations(raw):
+    """Parse registrations file content in either JSONL or legacy array form"""
+    stripped = raw.lstrip()
+    if not stripped:
+        return []
+    if stripped[:1] == b'[':
+        return json_loads(raw)
+    return [json_loads(line) for line in raw.splitlines() if line.strip()]
+
+def _registrations_jsonl(registrations):
+    """Serialize registrations as JSONL bytes"""
+    return b''.join(json_dumps(reg, indent=False) + b'\n' for reg in registrations)
+
+def read_registrations(filepath):
+    """Safely read all registrations from a registrations file"""
+    with get_file_rwlock(filepath).read():
+        if not os.path.exists(filepath):
+            return []
+        try:
+            with open(filepath, 'rb') as f:
+                return _parse_registrations(f.read())
+        except (JSONDecodeError, IOError) as e:
+            logger.error(f"Failed to read registrations from {filepath}: {e}")
+            backup_path = filepath + '.backup'
+            if os.path.exists(backup_path):
+                logger.info(f"Attempting to recover from backup: {backup_path}")
+                try:
+                    with open(backup_path, 'rb') as f:
+                        return _parse_registrations(f.read())
+                except:
+                    pass
+            return []
+
+def write_registrations(filepath, registrations):
+    """Safely rewrite a registrations file (atomic, with backup)"""
+    with get_file_rwlock(filepath).write():
+        result = _write_bytes_no_lock(filepath, _registrations_jsonl(registrations))
+        _registrations_cache.pop(filepath, None)
+        return result
+
+# fdatasync skips flushing inode metadata that isn't needed to read the data
+# back (e.g. mtime); not available on every platform
+_fdatasync = getattr(os, 'fdatasync', os.fsync)
+
+def _index_value(value, fold):
+    """Normalize a field value for RegistrationIndex (None if it can't be indexed)"""
+    if isinstance(value, str):
+        value = value.strip()
+        return value.lower() if fold else value
+    if fold or not isinstance(value, int):
+        return None
+    return value
+
+class RegistrationIndex:
+    """A file's registrations plus lazily built per-field sets for duplicate checks"""
+
+    def __init__(self, registrations):
+        self.registrations = registrations
+        self._sets = {}
+        self._entries = None
+
+    def _values(self, field, fold):
+        values = self._sets.get((field, fold))
+        if values is None:
+            values = {_index_value(r.get(field), fold) for r in self.registrations}
+            values.discard(None)
+            values.discard('')
+            self._sets[(field, fold)] = values
+        return values
+
+    def has(self, field, value, fold=False):
+        """True if an existing registration has this value for field
+
+        fold=True compares case-insensitively, ignoring surrounding whitespace
+        (for email fields).
+        """
+        value = _index_value(value, fold)
+        return value not in (None, '') and value in self._values(field, fold)
+
+    def find_entry(self, registration_id, email):
+        """Position of the registration with this registration_id and submitter
+        email (already lowercased), or None; built on first use"""
+        if self._entries is None:
+            entries = {}
+            for i, reg in enumerate(self.registrations):
+                entries.setdefault((reg.get('registration_id'), reg.get('submitter_email', '').lower()), i)
+            self._entries = entries
+        return self._entries.get((registration_id, email))
+
+    def add(self, registration):
+        self.registrations.append(registration)
+        for (field, fold), values in self._sets.items():
+            value = _index_value(registration.get(field), fold)
+            if value not in (None, ''):
+                values.add(value)
+        if self._entries is not None:
+            self._entries.setdefault(
+                (registration.get('registration_id'), registration.get('submitter_email', '').lower()),
+                len(self.registrations) - 1)
+
+# Registrations and their index for duplicate checks on the append path:
+# filepath -> ((st_mtime_ns, st_size), RegistrationIndex, appendable).
+# Only used inside atomic_add_registration and update_registration_entry
+# (under the file's write lock) and never handed to routes, which may
+# modify what they read.
+_registrations_cache = {}
+
+def _load_registrations_for_append(filepath):
+    """Return (RegistrationIndex, appendable) for filepath (caller holds the write lock)
+
+    appendable is False for legacy array files and files without a trailing
+    newline, which must be rewritten in full instead of appended to.
+    """
+    try:
+        st = os.stat(filepath)
+    except FileNotFoundError:
+        return RegistrationIndex([]), True
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _registrations_cache.get(filepath)
+    if cached and cached[0] == key:
+        return cached[1], cached[2]
+    with open(filepath, 'rb') as f:
+        raw = f.read()
+    index = RegistrationIndex(_parse_registrations(raw))
+    stripped = raw.lstrip()
+    appendable = not stripped or (stripped[:1] != b'[' and raw.endswith(b'\n'))
+    _registrations_cache[filepath] = (key, index, appendable)
+    return index, appendable
+
+# Next registration id per file: filepath -> ((st_mtime_ns, st_size), next_id).
+# Only trusted while the file is exactly as we last wrote it.
+_registration_ids = {}
+
+def _next_registration_id(filepath, registrations):
+    """Return the next registration id for filepath (caller holds the write lock)"""
+    cached = _registration_ids.get(filepath)
+    if cached:
+        try:
+            st = os.stat(filepath)
+            if cached[0] == (st.st_mtime_ns, st.st_size):
+                return cached[1]
+        except OSError:
+            pass
+    return max((r.get('id', 0) for r in registrations if isinstance(r.get('id'), int)), default=0) + 1
+
+# Registrations waiting to be committed: filepath -> [item, ...], where an
+# item is [new_registration, unique_check_fn, result]. Whichever request
+# takes the file's write lock next commits every pending item for that file
+# in one read, one write and one sync (group commit); the others find their
+# result already set when they get the lock.
+_pending_registrations = {}
+_pending_registrations_lock = threading.Lock()
+
 def atomic_add_registration(filepath, new_registration, unique_check_fn=None):
     """
-    Atomically add a registration to a JSON file.
+    Atomically add a registration to a registrations (JSONL) file.
     This ensures read-check-write happens in a single lock to prevent race conditions.
+    The lock is held only for that; build QR codes before calling this and
+    send emails after it returns. Concurrent calls for the same file are
+    committed together as one batch.
     
     Args:
-        filepath: Path to the registrations JSON file
+        filepath: Path to the registrations file
         new_registration: The registration dict to add
-        unique_check_fn: Optional function(registrations, new_reg) -> error_msg or None
-                        Returns error message if duplicate found, None if OK
+        unique_check_fn: Optional function(index, new_reg) -> error_msg or None,
+                        where index is a RegistrationIndex of the existing
+                        registrations. Returns error message if duplicate found, None if OK
     
     Returns:
         (success: bool, error_msg: str or None, registrations: list)
     """
-    lock = get_file_lock(filepath)
-    with lock:
-        # Read existing registrations inside the lock
-        registrations = []
-        if os.path.exists(filepath):
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    registrations = json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                logger.error(f"Failed to read JSON from {filepath}: {e}")
-                registrations = []
-        
-        # Check for duplicates if check function provided
+    item = [new_registration, unique_check_fn, None]
+    with _pending_registrations_lock:
+        _pending_registrations.setdefault(filepath, []).append(item)
+    
+    with get_file_rwlock(filepath).write():
+        if item[2] is None:
+            with _pending_registrations_lock:
+                batch = _pending_registrations.pop(filepath, [])
+            _commit_registrations(filepath, batch)
+    return item[2]
+
+def _commit_registrations(filepath, batch):
+    """Internal: check and write a batch of pending registrations (caller holds the write lock)"""
+    # Read existing registrations inside the lock
+    index = RegistrationIndex([])
+    appendable = False
+    if os.path.exists(filepath):
+        try:
+            index, appendable = _load_registrations_for_append(filepath)
+        except (JSONDecodeError, IOError) as e:
+            logger.error(f"Failed to read registrations from {filepath}: {e}")
+    
+    # Check each registration against the file plus those accepted earlier in the batch
+    next_id = _next_registration_id(filepath, index.registrations)
+    accepted = []
+    for item in batch:
+        new_registration, unique_check_fn = item[0], item[1]
         if unique_check_fn:
-            error_msg = unique_check_fn(registrations, new_registration)
+            try:
+                error_msg = unique_check_fn(index, new_registration)
+            except Exception as e:
+                logger.error(f"Duplicate check failed: {e}")
+                error_msg = f"Failed to save registration: {str(e)}"
             if error_msg:
-                return (False, error_msg, registrations)
+                item[2] = (False, error_msg, index.registrations)
+                continue
         
         # Assign sequential ID
-        new_registration['id'] = len(registrations) + 1
-        
-        # Append and write - all within the same lock
-        registrations.append(new_registration)
-        
+        new_registration['id'] = next_id
+        next_id += 1
+        index.add(new_registration)
+        accepted.append(item)
+    
+    if not accepted:
+        return
+    
+    try:
+        if appendable:
+            # One O_APPEND write for the whole batch, then a data-only sync
+            if len(index.registrations) == len(accepted):
+                os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            fd = os.open(filepath, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                os.write(fd, _registrations_jsonl(item[0] for item in accepted))
+                _fdatasync(fd)
+            finally:
+                os.close(fd)
+        else:
+            # Legacy array (or damaged) file: rewrite everything as JSONL
+            _write_bytes_no_lock(filepath, _registrations_jsonl(index.registrations))
+        st = os.stat(filepath)
+        key = (st.st_mtime_ns, st.st_size)
+        _registrations_cache[filepath] = (key, index, True)
+        _registration_ids[filepath] = (key, next_id)
+        for item in accepted:
+            item[2] = (True, None, index.registrations)
+    except Exception as e:
+        # The in-memory index already holds the batch; drop it so the next
+        # commit re-reads what actually reached the disk
+        _registrations_cache.pop(filepath, None)
+        logger.error(f"Failed to save registration: {e}")
+        for item in accepted:
+            item[2] = (False, f"Failed to save registration: {str(e)}", index.registrations)
+
+def update_registration_entry(filepath, registration_id, email, apply_fn):
+    """Apply apply_fn(registration) to one registration and rewrite the file
+
+    The registration is found by registration_id and submitter email (already
+    lowercased) through the cached append-path index, so a burst of entry
+    scans re-parses nothing while the file is as we last wrote it. apply_fn
+    gets a copy; the whole read-modify-write holds the file's write lock.
+    Returns False if there is no such registration.
+    """
+    with get_file_rwlock(filepath).write():
+        index, _ = _load_registrations_for_append(filepath)
+        position = index.find_entry(registration_id, email)
+        if position is None:
+            return False
+        registration = dict(index.registrations[position])
+        apply_fn(registration)
+        index.registrations[position] = registration
         try:
-            _write_json_no_lock(filepath, registrations)
-            return (True, None, registrations)
-        except Exception as e:
-            logger.error(f"Failed to save registration: {e}")
-            return (False, f"Failed to save registration: {str(e)}", registrations)
-
-# Get the absolute path of the directory containing this file (AICC/)
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+            _write_bytes_no_lock(filepath, _registrations_jsonl(index.registrations))
+            st = os.stat(filepath)
+        except Exception:
+            # The cached index holds the change; drop it so the next reader
+            # re-reads what actually reached the disk
+            _registrations_cache.pop(filepath, None)
+            raise
+        _registrations_cache[filepath] = ((st.st_mtime_ns, st.st_size), index, True)
+    return True
+
+# BASE_DIR (the AICC/ directory) is resolved once in config.py
 # All data, templates, and static folders are in the same AICC directory
 PROJECT_ROOT = BASE_DIR
 
+@contextmanager
+def _startup_lock():
+    """Serialize first-run setup across worker processes starting together"""
+    if fcntl is None:
+        yield
+        return
+    with open(os.path.join(PROJECT_ROOT, '.initialized.lock'), 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
 # Function to ensure all required folders and files exist
 def initialize_app_structure():
     """Create all necessary folders and files if they don't exist"""
@@ -230,8 +695,15 @@ def initialize_app_structure():
         os.path.join(PROJECT_ROOT, 'templates/admin'),
     ]
     
-    for directory in directories:
-        os.makedirs(directory, exist_ok=True)
+    # The directory tree only needs creating once; the sentinel spares every
+    # later start (and every WSGI worker) the makedirs calls
+    sentinel = os.path.join(PROJECT_ROOT, '.initialized')
+    if not os.path.exists(sentinel):
+        with _startup_lock():
+            if not os.path.exists(sentinel):
+                for directory in directories:
+                    os.makedirs(directory, exist_ok=True)
+                open(sentinel, 'w').close()
     
     # Create default JSON files if they don't exist
     data_files = {
@@ -250,18 +722,72 @@ def initialize_app_structure():
         'data/gallery.json': []
     }
     
-    for file_path, default_content in data_files.items():
-        full_path = os.path.join(PROJECT_ROOT, file_path)
-        if not os.path.exists(full_path):
-            with open(full_path, 'w') as f:
-                json.dump(default_content, f, indent=4)
+    # Seed missing data files, listing data/ once instead of a stat per file
+    data_dir = os.path.join(PROJECT_ROOT, 'data')
+    try:
+        with os.scandir(data_dir) as entries:
+            existing = {entry.name for entry in entries}
+    except FileNotFoundError:
+        os.makedirs(data_dir, exist_ok=True)
+        existing = set()
+    missing = [file_path for file_path in data_files if os.path.basename(file_path) not in existing]
+    if missing:
+        with _startup_lock():
+            for file_path in missing:
+                full_path = os.path.join(PROJECT_ROOT, file_path)
+                if not os.path.exists(full_path):
+                    with open(full_path, 'wb') as f:
+                        f.write(json_dumps(data_files[file_path]))
+    
+    # One-time migration of the old array format of events.json to
+    # {"next_id": ..., "events": [...]}; readers only accept the new format
+    events_path = os.path.join(PROJECT_ROOT, 'data/events.json')
+    with open(events_path, 'r') as f:
+        events_data = json_loads(f.read())
+    if isinstance(events_data, list):
+        # Re-check under the locks: another worker may have migrated it first
+        with _startup_lock(), get_file_rwlock(events_path).write():
+            with open(events_path, 'rb') as f:
+                events_data = json_loads(f.read())
+            if isinstance(events_data, list):
+                max_id = max([e.get('id', 0) for e in events_data], default=0)
+                _write_bytes_no_lock(events_path, json_dumps({"next_id": max_id + 1, "events": events_data}))
+                logger.info("Migrated events.json to the next_id/events format")
+
+def _events_from_data(events_data):
+    """Check that parsed events.json data is in the (migrated) object format"""
+    if not isinstance(events_data, dict):
+        raise ValueError("events.json must be an object with 'next_id' and 'events'; "
+                         "restart the app to migrate the old list format")
+    return events_data
 
 # Initialize app structure on startup
 initialize_app_structure()
 
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider (request.get_json, jsonify) backed by orjson"""
+
+    def dumps(self, obj, **kwargs):
+        if kwargs:  # explicit stdlib options such as indent
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if self.compact is False or (self.compact is None and self._app.debug):
+            return super().response(*args, **kwargs)  # pretty-printed
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self.default,
+                            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
 app = Flask(__name__, 
             template_folder=os.path.join(PROJECT_ROOT, 'templates'),
             static_folder=os.path.join(PROJECT_ROOT, 'static'))
+if orjson:
+    app.json = OrjsonProvider(app)
 # SECURITY: Use environment variable for secret key in production
 app.secret_key = os.environ.get('FLASK_SECRET_KEY', 'your-secret-key-change-this-in-production')
 
@@ -270,14 +796,36 @@ CORS(app)
 app.config['UPLOAD_FOLDER'] = os.path.join(PROJECT_ROOT, 'static/uploads')
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 0  # Disable caching in development
+if Compress:
+    # gzip/brotli JSON API responses (event/member/gallery/registration lists
+    # compress several-fold) when the client sends Accept-Encoding
+    app.config['COMPRESS_MIMETYPES'] = ['application/json']
+    Compress(app)
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
 
 # Initialize Flask-Mail (will be configured from club_info.json)
 mail = Mail(app)
 
+# Background workers for slow outbound I/O (SMTP) so requests return immediately
+EXECUTOR = ThreadPoolExecutor(max_workers=8)
+atexit.register(EXECUTOR.shutdown)
+
+def submit_background(fn, *args, **kwargs):
+    """Run fn on the background executor inside an app context"""
+    def run():
+        with app.app_context():
+            return fn(*args, **kwargs)
+    return EXECUTOR.submit(run)
+
+# email_config most recently applied by configure_mail()
+_mail_config_applied = None
+_mail_config_lock = threading.Lock()
+
 def configure_mail():
     """Configure Flask-Mail from club_info.json"""
-    email_config = CLUB_INFO.get('email_config', {})
+    global _mail_config_applied
+    email_config = load_data().club_info.get('email_config', {})
+    _mail_config_applied = email_config
     if email_config:
         app.config['MAIL_SERVER'] = email_config.get('MAIL_SERVER', 'smtp.gmail.com')
         app.config['MAIL_PORT'] = email_config.get('MAIL_PORT', 587)
@@ -287,32 +835,118 @@ def configure_mail():
         app.config['MAIL_DEFAULT_SENDER'] = email_config.get('MAIL_DEFAULT_SENDER', '')
         mail.init_app(app)
 
+def ensure_mail_configured():
+    """Re-run configure_mail() only if the email settings changed since it last ran"""
+    email_config = load_data().club_info.get('email_config', {})
+    if email_config == _mail_config_applied:
+        return
+    with _mail_config_lock:
+        if email_config != _mail_config_applied:
+            configure_mail()
+
+# Immutable view of all four data files. load_data() publishes a new
+# snapshot (a single atomic assignment) whenever any file changes, so
+# routes read one consistent object instead of rebinding module globals.
+DataSnapshot = namedtuple('DataSnapshot', ['club_info', 'events', 'members', 'gallery'])
+_DATA_FILE_NAMES = ('club_info.json', 'events.json', 'members.json', 'gallery.json')
+# (stat keys of the four files, snapshot built from them)
+_snapshot_entry = None
+
+# Parsed data files: filename -> ((st_mtime_ns, st_size), data)
+_data_cache = {}
+
+def _data_file_key(filename):
+    st = os.stat(os.path.join(PROJECT_ROOT, 'data', filename))
+    return (st.st_mtime_ns, st.st_size)
+
+def _load_data_file(filename, key=None):
+    """Load a JSON file from data/, re-parsing only when it changed on disk"""
+    filepath = os.path.join(PROJECT_ROOT, 'data', filename)
+    if key is None:
+        key = _data_file_key(filename)
+    cached = _data_cache.get(filename)
+    if cached and cached[0] == key:
+        return cached[1]
+    with open(filepath, 'rb') as f:
+        data = json_loads(f.read())
+    _data_cache[filename] = (key, data)
+    return data
+
 # Function to load data from JSON files
 def load_data():
-    """Reload all data from JSON files"""
-    data_dir = os.path.join(PROJECT_ROOT, 'data')
-    with open(os.path.join(data_dir, 'club_info.json'), 'r') as f:
-        club_info = json.load(f)
-    with open(os.path.join(data_dir, 'events.json'), 'r') as f:
-        events_data = json.load(f)
-        # Handle both old array format and new object format
-        if isinstance(events_data, list):
-            # Migrate old format: convert array to object with next_id
-            max_id = max([e.get('id', 0) for e in events_data], default=0)
-            events = events_data
-            # Save migrated format
-            with open(os.path.join(data_dir, 'events.json'), 'w') as fw:
-                json.dump({"next_id": max_id + 1, "events": events}, fw, indent=4)
-        else:
-            events = events_data.get('events', [])
-    with open(os.path.join(data_dir, 'members.json'), 'r') as f:
-        members = json.load(f)
-    with open(os.path.join(data_dir, 'gallery.json'), 'r') as f:
-        gallery = json.load(f)
-    return club_info, events, members, gallery
+    """Return the current DataSnapshot of all JSON data files
+
+    Files are only re-read when their mtime/size changes, so read-only routes
+    don't hit the disk on every request. Callers must not mutate the returned
+    objects in place without writing them back to disk.
+    """
+    global _snapshot_entry
+    keys = tuple(_data_file_key(name) for name in _DATA_FILE_NAMES)
+    entry = _snapshot_entry
+    if entry is not None and entry[0] == keys:
+        # Nothing changed on disk: no parsing, no per-file cache lookups
+        return entry[1]
+    
+    club_info, events_data, members, gallery = (
+        _load_data_file(name, key) for name, key in zip(_DATA_FILE_NAMES, keys))
+    snap = DataSnapshot(club_info, _events_from_data(events_data).get('events', []), members, gallery)
+    _snapshot_entry = (keys, snap)
+    return snap
+
+def load_events():
+    """Current events list, as in load_data().events, checking only events.json"""
+    return _events_from_data(_load_data_file('events.json')).get('events', [])
+
+# Newest unwritten payload per JSON file: filepath -> (seq, data). Saves of a
+# file that arrive while another save holds its write lock collapse into one
+# rewrite with the newest payload (the same end state as writing them in
+# order); a superseded save returns once that rewrite has finished.
+_pending_json_writes = {}
+_written_json_seq = {}
+_pending_json_lock = threading.Lock()
+_json_write_seq = itertools.count(1)
+
+def write_json_file(filepath, data):
+    """Write data to filepath as JSON, coalescing concurrent saves of the file
+
+    Returns ((st_mtime_ns, st_size), payload) for the rewrite done by this
+    call, or None if a concurrent call already wrote a newer payload.
+    """
+    with _pending_json_lock:
+        seq = next(_json_write_seq)
+        _pending_json_writes[filepath] = (seq, data)
+    
+    with get_file_rwlock(filepath).write():
+        if _written_json_seq.get(filepath, 0) >= seq:
+            return None
+        with _pending_json_lock:
+            seq, payload = _pending_json_writes.pop(filepath)
+        try:
+            # Temp file + os.replace: readers that don't take the lock
+            # (load_data) never see a truncated file
+            _write_bytes_no_lock(filepath, json_dumps(payload))
+            st = os.stat(filepath)
+        except Exception:
+            # Leave the payload queued (unless a newer one arrived) so a
+            # waiting save retries it instead of reporting success
+            with _pending_json_lock:
+                _pending_json_writes.setdefault(filepath, (seq, payload))
+            raise
+        _written_json_seq[filepath] = seq
+        return (st.st_mtime_ns, st.st_size), payload
+
+def save_data_file(filename, data):
+    """Write a JSON file in data/ and prime the parse cache with the written object
+
+    The next load_data() then picks up the change from the new stat key
+    without reading the file back.
+    """
+    written = write_json_file(os.path.join(PROJECT_ROOT, 'data', filename), data)
+    if written:
+        _data_cache[filename] = written
 
 # Load initial data
-CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+load_data()
 
 # Configure mail with loaded data
 configure_mail()
@@ -321,26 +955,76 @@ def load_events_file():
     """Load events.json and return (events_list, next_id)"""
     events_file = os.path.join(PROJECT_ROOT, 'data/events.json')
     with open(events_file, 'r') as f:
-        events_data = json.load(f)
+        events_data = _events_from_data(json_loads(f.read()))
     
-    if isinstance(events_data, list):
-        # Old format - migrate
-        events = events_data
-        next_id = max([e.get('id', 0) for e in events], default=0) + 1
-    else:
-        events = events_data.get('events', [])
-        next_id = events_data.get('next_id', 1)
-    
-    return events, next_id
+    return events_data.get('events', []), events_data.get('next_id', 1)
+
+def load_event_for_update(event_id):
+    """Load events.json to change a single event; returns (events, next_id, event)
+
+    Copy-on-write over the cached parse: events is a new list sharing every
+    entry with the snapshot except event (found through the id index), which
+    is a private copy that is safe to mutate before save_events_file().
+    event is None if there is no such id.
+    """
+    events_data = _events_from_data(_load_data_file('events.json'))
+    cached = events_data.get('events', [])
+    next_id = events_data.get('next_id', 1)
+    event = get_event_by_id(cached, event_id)
+    if event is None:
+        return list(cached), next_id, None
+    copy = dict(event)
+    return [copy if e is event else e for e in cached], next_id, copy
 
 def save_events_file(events, next_id):
     """Save events list with next_id to events.json"""
-    events_file = os.path.join(PROJECT_ROOT, 'data/events.json')
-    with open(events_file, 'w') as f:
-        json.dump({"next_id": next_id, "events": events}, f, indent=4)
+    save_data_file('events.json', {"next_id": next_id, "events": events})
     # Update chatbot context cache
     update_events_context_cache(events)
 
+# Parsed form_templates.json: ((st_mtime_ns, st_size), templates, templates_by_id,
+# unique_email_fields_by_id)
+_templates_cache = None
+_EMPTY_TEMPLATES = (None, [], {}, {})
+
+def _unique_email_fields(template):
+    """(name, label) of a template's unique email fields other than submitter_email"""
+    return tuple(
+        (field.get('name'), field.get('label', field.get('name')))
+        for field in template.get('fields', [])
+        if field.get('type') == 'email' and field.get('unique', False)
+        and field.get('name') != 'submitter_email'
+    )
+
+def _load_form_templates():
+    global _templates_cache
+    templates_file = os.path.join(PROJECT_ROOT, 'data', 'form_templates.json')
+    try:
+        st = os.stat(templates_file)
+    except FileNotFoundError:
+        return _EMPTY_TEMPLATES
+    key = (st.st_mtime_ns, st.st_size)
+    cache = _templates_cache
+    if cache is None or cache[0] != key:
+        with open(templates_file, 'rb') as f:
+            templates = json_loads(f.read())
+        cache = (key, templates, {t.get('id'): t for t in templates},
+                 {t.get('id'): _unique_email_fields(t) for t in templates})
+        _templates_cache = cache
+    return cache
+
+def get_form_templates():
+    """Return (templates, templates_by_id), re-parsing only when the file changed
+
+    Read-only: routes that edit templates load and save the file themselves.
+    """
+    cache = _load_form_templates()
+    return cache[1], cache[2]
+
+def get_template_unique_email_fields(template_id):
+    """Precomputed (name, label) pairs checked for duplicates on registration"""
+    return _load_form_templates()[3].get(template_id, ())
+
 # Add cache-busting filter
 @app.template_filter('cache_bust')
 def cache_bust_filter(url):
@@ -355,6 +1039,13 @@ app.jinja_env.filters['cache_bust'] = cache_bust_filter
 # Make datetime.now available in templates
 app.jinja_env.globals['now'] = datetime.now
 
+# Compiled templates: keep them all in memory, skip the per-render mtime
+# check outside debug, and persist the bytecode (in a private per-user temp
+# directory) so restarted workers don't recompile every page
+app.jinja_env.cache = {}
+app.jinja_env.auto_reload = app.debug
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+
 # Admin credentials - loaded from environment variables with insecure defaults
 # SECURITY: Set ADMIN_USERNAME and ADMIN_PASSWORD environment variables in production
 ADMIN_USERNAME = os.environ.get('ADMIN_USERNAME', 'admin')
@@ -366,33 +1057,66 @@ def allowed_file(filename):
 
 def sort_members_by_role(members, role_hierarchy, year_hierarchy):
     """Sort members by predefined role hierarchy and year (descending)"""
+    # Rank lookups built once per sort instead of a list.index() per member;
+    # setdefault keeps the first position of a repeated entry, like index()
+    role_rank = {}
+    for i, role in enumerate(role_hierarchy):
+        role_rank.setdefault(role, i)
+    year_rank = {}
+    for i, year in enumerate(year_hierarchy):
+        year_rank.setdefault(year, -i)  # Negative for descending
+    unranked_role = len(role_hierarchy)  # Roles not in the hierarchy go at the end
+    
     def get_sort_key(member):
-        role = member.get('role', '')
-        year = member.get('year', '')
-        
-        # Get role index
-        try:
-            role_index = role_hierarchy.index(role)
-        except ValueError:
-            # If role not in hierarchy, put at the end
-            role_index = len(role_hierarchy)
-        
-        # Get year index (negative for descending order)
-        try:
-            year_index = -year_hierarchy.index(year)  # Negative for descending
-        except ValueError:
-            # If year not in hierarchy, put at the end
-            year_index = 0
-        
-        return (role_index, year_index)
+        # Years not in the hierarchy go at the end
+        return (role_rank.get(member.get('role', ''), unranked_role),
+                year_rank.get(member.get('year', ''), 0))
     
+    # Callers pass a list already in order apart from the member just added
+    # or edited, which Timsort handles in close to linear time
     return sorted(members, key=get_sort_key)
 
+# Precompiled patterns used on the request path
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+@lru_cache(maxsize=1024)
 def slugify(value):
-    """Create a URL-safe slug from text"""
-    value = (value or '').strip().lower()
-    value = re.sub(r'[^a-z0-9]+', '-', value)
-    return value.strip('-') or 'event'
+    """Create a URL-safe slug from text (memoized; event names repeat on every request)"""
+    return _SLUG_RE.sub('-', (value or '').strip().lower()).strip('-') or 'event'
+
+@lru_cache(maxsize=1024)
+def _registration_file_slug(name):
+    """'_'-separated slug of an event name used in registration file names"""
+    return _SLUG_RE.sub('_', name.lower()).strip('_')
+
+def create_registration_file(event):
+    """Create an event's (empty, JSONL) registrations file and set its registration_file
+
+    The file name includes the event id, so events with the same name get
+    different files. An existing file is left untouched.
+    """
+    reg_filename = f"{_registration_file_slug(event['name'])}_{event['id']}_registrations.json"
+    reg_file_path = os.path.join(PROJECT_ROOT, 'data', 'registrations', reg_filename)
+    os.makedirs(os.path.dirname(reg_file_path), exist_ok=True)
+    # Append mode creates the file if missing without truncating it
+    open(reg_file_path, 'a').close()
+    event['registration_file'] = f'data/registrations/{reg_filename}'
+
+# Uploaded files are named <epoch seconds>_<pid>_<counter>_<original name>,
+# unique within a second and across worker processes
+_upload_counter = itertools.count()
+_upload_dir_ready = False
+
+def save_upload(file):
+    """Save an uploaded file under a unique name in the uploads folder; returns its URL"""
+    global _upload_dir_ready
+    if not _upload_dir_ready:
+        os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+        _upload_dir_ready = True
+    filename = f"{int(time.time())}_{os.getpid()}_{next(_upload_counter)}_{secure_filename(file.filename)}"
+    file.save(os.path.join(app.config['UPLOAD_FOLDER'], filename))
+    return f"/static/uploads/{filename}"
 
 def delete_old_image(image_path):
     """Delete old image file if it exists in uploads folder"""
@@ -407,8 +1131,14 @@ def delete_old_image(image_path):
             pass
 
 def generate_qr_code(data_string):
-    """Generate QR code and return as base64 encoded string"""
+    """Generate QR code and return it as PNG bytes"""
     try:
+        if segno:
+            # segno writes the PNG itself, without rasterizing through PIL
+            buffer = BytesIO()
+            segno.make_qr(data_string, error='l').save(buffer, kind='png', scale=10, border=4)
+            return buffer.getvalue()
+        
         qr = qrcode.QRCode(
             version=1,
             error_correction=qrcode.constants.ERROR_CORRECT_L,
@@ -418,38 +1148,50 @@ def generate_qr_code(data_string):
         qr.add_data(data_string)
         qr.make(fit=True)
         
-        img = qr.make_image(fill_color="black", back_color="white")
+        img = qr.make_image(image_factory=PilImage, fill_color="black", back_color="white")
         
-        # Convert to base64
         buffer = BytesIO()
-        img.save(buffer, format='PNG')
-        buffer.seek(0)
-        img_base64 = base64.b64encode(buffer.getvalue()).decode()
-        
-        return img_base64
+        img.save(buffer, format='PNG', optimize=True)
+        return buffer.getvalue()
     except Exception as e:
         logger.error(f"QR code generation error: {e}")
         return None
 
-def send_registration_email(email, registration_id, qr_code_base64, event_name, registration_data):
-    """Send registration confirmation email with QR code"""
+@lru_cache(maxsize=2048)
+def shareable_qr_base64(url):
+    """Base64 PNG QR code for an attendance shareable link, or None"""
+    qr_png = generate_qr_code(url)
+    return base64.b64encode(qr_png).decode() if qr_png else None
+
+def registration_qr_url(registration_id, email, event_id):
+    """Admin entry-verification URL encoded in a registration's QR code"""
+    query = urlencode({'regid': registration_id, 'email': email, 'event_id': event_id})
+    return f"{request.host_url}admin/verify-entry?{query}"
+
+def registration_qr_path(registration_id):
+    """Project-relative path of a registration's QR PNG, or None for an unusable id"""
+    filename = secure_filename(str(registration_id))
+    return f'data/registrations/qr/{filename}.png' if filename else None
+
+def save_registration_qr(qr_path, qr_png):
+    """Write a QR PNG out-of-line so it is not carried in the registrations file"""
     try:
-        configure_mail()  # Reconfigure mail in case settings changed
-        
-        msg = Message(
-            subject=f'Registration Confirmation - {event_name}',
-            recipients=[email]
-        )
-        
-        # Create HTML email body with CID reference for QR code
-        # Escape user-provided data to prevent XSS
-        safe_name = html_escape(registration_data.get('name', 'Participant'))
-        safe_event_name = html_escape(event_name)
-        safe_registration_id = html_escape(str(registration_id))
-        safe_club_name = html_escape(CLUB_INFO.get('name', 'AI Coding Club'))
-        safe_college = html_escape(CLUB_INFO.get('college', ''))
-        
-        html_body = f"""
+        full_path = os.path.join(PROJECT_ROOT, qr_path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, 'wb') as f:
+            f.write(qr_png)
+    except OSError as e:
+        logger.error(f"Failed to save QR code {qr_path}: {e}")
+
+def _await_qr(qr_future, record):
+    """Wait for a QR code submitted to EXECUTOR, point record at its file and return the PNG"""
+    qr_png = qr_future.result()
+    if qr_png:
+        record['qr_code_path'] = registration_qr_path(record.get('registration_id'))
+    return qr_png
+
+# Registration confirmation email; filled in with str.format_map
+_EMAIL_HTML_TEMPLATE = """
         <html>
             <body style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto; padding: 20px;">
                 <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 30px; text-align: center; border-radius: 10px 10px 0 0;">
@@ -490,16 +1232,54 @@ def send_registration_email(email, registration_id, qr_code_base64, event_name,
             </body>
         </html>
         """
+
+# (club_info, safe_club_name, safe_college) for the current snapshot
+_email_club_fields = None
+
+def _escaped_club_fields(club_info):
+    """Escape the club name/college once per club_info snapshot"""
+    global _email_club_fields
+    cached = _email_club_fields
+    if cached is None or cached[0] is not club_info:
+        cached = (club_info,
+                  html_escape(club_info.get('name', 'AI Coding Club')),
+                  html_escape(club_info.get('college', '')))
+        _email_club_fields = cached
+    return cached[1], cached[2]
+
+def send_registration_email(email, registration_id, qr_png, event_name, registration_data):
+    """Send registration confirmation email with QR code"""
+    try:
+        ensure_mail_configured()  # Reconfigure mail only if settings changed
+        
+        msg = Message(
+            subject=f'Registration Confirmation - {event_name}',
+            recipients=[email]
+        )
+        
+        # Create HTML email body with CID reference for QR code
+        # Escape user-provided data to prevent XSS
+        safe_name = html_escape(registration_data.get('name', 'Participant'))
+        safe_event_name = html_escape(event_name)
+        safe_registration_id = html_escape(str(registration_id))
+        safe_club_name, safe_college = _escaped_club_fields(load_data().club_info)
+        
+        html_body = _EMAIL_HTML_TEMPLATE.format_map({
+            'safe_name': safe_name,
+            'safe_event_name': safe_event_name,
+            'safe_registration_id': safe_registration_id,
+            'safe_club_name': safe_club_name,
+            'safe_college': safe_college,
+        })
         
         msg.html = html_body
         
         # Attach QR code as inline image with Content-ID
-        if qr_code_base64:
-            qr_image_data = base64.b64decode(qr_code_base64)
+        if qr_png:
             msg.attach(
                 filename='qrcode.png',
                 content_type='image/png',
-                data=qr_image_data,
+                data=qr_png,
                 disposition='inline',
                 headers={'Content-ID': '<qrcode>'}
             )
@@ -510,6 +1290,10 @@ def send_registration_email(email, registration_id, qr_code_base64, event_name,
         logger.error(f"Email sending error: {e}")
         return False
 
+# Suffix for Razorpay order receipts; seeded from the clock (ms) so ids stay
+# unique across restarts, then a lock-free increment per order
+_ORDER_COUNTER = itertools.count(time.time_ns() // 1_000_000)
+
 def create_razorpay_order(order_id, amount, customer_name, customer_email, customer_phone, return_url):
     """Create a Razorpay payment order"""
     try:
@@ -539,7 +1323,7 @@ def create_razorpay_order(order_id, amount, customer_name, customer_email, custo
             }
         }
         
-        response = requests.post(url, json=payload, headers=headers, auth=auth)
+        response = HTTP.post(url, json=payload, headers=headers, auth=auth, timeout=RAZORPAY_TIMEOUT)
         
         if response.status_code == 200:
             razorpay_response = response.json()
@@ -568,116 +1352,60 @@ def create_razorpay_order(order_id, amount, customer_name, customer_email, custo
 def home():
     """Home page with hero section and registration deadline"""
     # Reload data to get latest changes
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
-    
-    # Filter out hidden events
-    visible_events = [e for e in EVENTS if e.get('show_in_events', True)]
-    
-    # Sort events: with register_link first, then by status (upcoming first)
-    sorted_events = sorted(visible_events, key=lambda x: (
-        not bool(x.get('register_link')),  # Events with register_link first
-        x.get('status') != 'upcoming',     # Then upcoming events
-        x.get('status') == 'completed'     # Then completed
-    ))
-    
-    # Find the next event with an active registration deadline (sorted by earliest deadline)
-    next_deadline_event = None
-    valid_deadline_events = []
-    
-    for event in visible_events:
-        # Only consider upcoming events with registration deadlines
-        if event.get('status') == 'upcoming':
-            if event.get('registration_deadline') and event.get('register_link'):
-                deadline_date = event['registration_deadline']['date']
-                try:
-                    # Try multiple date formats
-                    deadline = None
-                    for date_format in ['%Y-%m-%d', '%B %d, %Y']:
-                        try:
-                            deadline = datetime.strptime(deadline_date, date_format)
-                            break
-                        except ValueError:
-                            continue
-                    
-                    # Using IST for comparison
-                    if deadline and deadline.date() >= get_ist_now().date():
-                        valid_deadline_events.append((deadline, event))
-                except Exception as e:
-                    pass
+    snap = load_data()
+    top3, deadline_events = get_events_cache(snap.events)[2:4]
     
-    # Sort by earliest deadline and pick the first one
-    if valid_deadline_events:
-        valid_deadline_events.sort(key=lambda x: x[0])
-        next_deadline_event = valid_deadline_events[0][1]
+    # Next event whose registration deadline hasn't passed (using IST)
+    today = get_ist_today()
+    next_deadline_event = next((event for deadline, event in deadline_events if deadline >= today), None)
     
     return render_template('index.html', 
-                         club_info=CLUB_INFO, 
-                         events=sorted_events[:3],  # Show only top 3 events on home
-                         contact=CLUB_INFO,
+                         club_info=snap.club_info, 
+                         events=top3,  # Show only top 3 events on home
+                         contact=snap.club_info,
                          next_deadline_event=next_deadline_event)
 
 @app.route('/about')
 def about():
     """About page"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+    snap = load_data()
     return render_template('about.html', 
-                         club_info=CLUB_INFO,
-                         contact=CLUB_INFO)
+                         club_info=snap.club_info,
+                         contact=snap.club_info)
 
 @app.route('/events')
 def events():
     """Events page showing all events"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
-    # Filter out hidden events, then sort
-    visible_events = [e for e in EVENTS if e.get('show_in_events', True)]
-    sorted_events = sorted(visible_events, key=lambda x: (
-        not bool(x.get('register_link')),  # Events with register_link first
-        x.get('status') != 'upcoming',     # Then upcoming events
-        x.get('status') == 'completed'     # Then completed
-    ))
+    snap = load_data()
+    sorted_events = get_events_cache(snap.events)[1]
     return render_template('events.html', 
                          events=sorted_events,
-                         club_info=CLUB_INFO,
-                         contact=CLUB_INFO)
-
-@app.route('/api/chatbot', methods=['POST'])
-def chatbot_api():
-    """Chatbot API endpoint using Groq with conversation history"""
-    try:
-        data = request.get_json()
-        user_message = data.get('message', '').strip()
-        history = data.get('history', [])  # Last N messages [{role, content}, ...]
-        
-        if not user_message:
-            return jsonify({'error': 'Message is required'}), 400
-        
-        # Get cached events context
-        events_context = get_events_context()
-        
-        # Get contact details from club_info
-        club_info, _, _, _ = load_data()
-        
-        # Build contact context
-        faculty_contacts = "\n".join([
-            f"  - {f.get('name')}: {f.get('phone')}" 
-            for f in club_info.get('faculty_coordinators', [])
-        ])
-        secretary_contacts = "\n".join([
-            f"  - {s.get('name')}: {s.get('phone')}" 
-            for s in club_info.get('secretaries', [])
-        ])
-        
-        # Build event links context with IDs for linking
-        events_list, _ = load_events_file()
-        events_with_links = "\n".join([
-            f"- {e.get('name')} (ID: {e.get('id')}): {e.get('description', 'No description')} | Date: {e.get('date')} | Status: {e.get('status')} | Location: {e.get('location')} | Link: /events/{e.get('id')} | Register: /events/{e.get('id')}/register"
-            for e in events_list if e.get('show_in_events', True)
-        ])
-        
-        system_prompt = f"""You are a helpful assistant for AI Coding Club (AICC) at Kongu Engineering College. You help users with information about club events, registrations, and general queries.
+                         club_info=snap.club_info,
+                         contact=snap.club_info)
+
+# Chatbot system prompt, rebuilt only when club info or events change:
+# (club_info, events_list, prompt)
+_system_prompt_cache = None
+
+def build_chatbot_system_prompt(club_info, events_list):
+    """Build the chatbot system prompt from club info and the event list"""
+    # Build contact context
+    faculty_contacts = "\n".join([
+        f"  - {f.get('name')}: {f.get('phone')}" 
+        for f in club_info.get('faculty_coordinators', [])
+    ])
+    secretary_contacts = "\n".join([
+        f"  - {s.get('name')}: {s.get('phone')}" 
+        for s in club_info.get('secretaries', [])
+    ])
+    
+    # Build event links context with IDs for linking
+    events_with_links = "\n".join([
+        f"- {e.get('name')} (ID: {e.get('id')}): {e.get('description', 'No description')} | Date: {e.get('date')} | Status: {e.get('status')} | Location: {e.get('location')} | Link: /events/{e.get('id')} | Register: /events/{e.get('id')}/register"
+        for e in events_list if e.get('show_in_events', True)
+    ])
+    
+    system_prompt = f"""You are a helpful assistant for AI Coding Club (AICC) at Kongu Engineering College. You help users with information about club events, registrations, and general queries.
 
 About AICC:
 - AI Coding Club empowers students to learn, build, and innovate in AI and software development
@@ -736,6 +1464,31 @@ Guidelines:
   * For links, use ONLY the format [LinkText](/path) - this is the ONLY special syntax supported in this chat
   * Example of GOOD formatting: "Here are upcoming events:\\n\\n1) [Thinkathon](/events/1) -> Jan 31, 2027, AI BLOCK\\n2) [Workshop](/events/2) -> Jan 29, 2026, AI BLOCK"
   * Example of BAD formatting (NEVER do this): "**Upcoming Events**\\n- *Thinkathon*: Jan 31" -- the ** and * and - will show as raw characters"""
+    return system_prompt
+
+def get_chatbot_system_prompt(snap):
+    """Get the cached system prompt for this data snapshot"""
+    global _system_prompt_cache
+    cache = _system_prompt_cache
+    if cache is None or cache[0] is not snap.club_info or cache[1] is not snap.events:
+        cache = (snap.club_info, snap.events, build_chatbot_system_prompt(snap.club_info, snap.events))
+        _system_prompt_cache = cache
+    return cache[2]
+
+@app.route('/api/chatbot', methods=['POST'])
+def chatbot_api():
+    """Chatbot API endpoint using Groq with conversation history"""
+    try:
+        data = request.get_json()
+        user_message = data.get('message', '').strip()
+        history = data.get('history', [])  # Last N messages [{role, content}, ...]
+        
+        if not user_message:
+            return jsonify({'error': 'Message is required'}), 400
+        
+        snap = load_data()
+        api_config = get_api_config()
+        system_prompt = get_chatbot_system_prompt(snap)
         
         # Build messages list with conversation history (last 5 exchanges)
         messages = [{'role': 'system', 'content': system_prompt}]
@@ -752,19 +1505,19 @@ Guidelines:
         messages.append({'role': 'user', 'content': user_message})
         
         # Call Groq API
-        response = requests.post(
+        response = HTTP.post(
             'https://api.groq.com/openai/v1/chat/completions',
             headers={
-                'Authorization': f'Bearer {get_groq_api_key()}',
+                'Authorization': f'Bearer {get_groq_api_key(api_config)}',
                 'Content-Type': 'application/json'
             },
             json={
-                'model': get_groq_model(),
+                'model': get_groq_model(api_config),
                 'messages': messages,
                 'max_tokens': 400,
                 'temperature': 0.7
             },
-            timeout=30
+            timeout=GROQ_TIMEOUT
         )
         
         if response.status_code == 200:
@@ -784,23 +1537,21 @@ Guidelines:
 @app.route('/events/<int:event_id>')
 def event_detail(event_id):
     """Individual event detail page"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
-    event = next((e for e in EVENTS if e.get('id') == event_id), None)
+    snap = load_data()
+    event = get_event_by_id(snap.events, event_id)
     if not event:
         return render_template('404.html'), 404
     return render_template('event_detail.html',
                          event=event,
-                         club_info=CLUB_INFO,
-                         contact=CLUB_INFO)
+                         club_info=snap.club_info,
+                         contact=snap.club_info)
 
 @app.route('/events/<int:event_id>/register')
 def event_register(event_id):
     """Event registration form page"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+    snap = load_data()
     
-    event = next((e for e in EVENTS if e.get('id') == event_id), None)
+    event = get_event_by_id(snap.events, event_id)
     if not event:
         return render_template('404.html'), 404
     
@@ -824,22 +1575,20 @@ def event_register(event_id):
         try:
             deadline_date = deadline_info['date']
             if deadline_date.upper() != 'TBA':
-                deadline = datetime.strptime(deadline_date, '%Y-%m-%d')
+                deadline = date.fromisoformat(deadline_date)
                 # Registration closes after the deadline day (deadline day is last day to register)
                 # Using IST for comparison
-                if deadline.date() < get_ist_now().date():
+                if deadline < get_ist_today():
                     deadline_passed = True
         except ValueError:
             pass
     
     # Load form templates
-    templates_file = os.path.join(PROJECT_ROOT, 'data', 'form_templates.json')
     try:
-        with open(templates_file, 'r') as f:
-            templates = json.load(f)
+        _, templates_by_id = get_form_templates()
         
         # Find the template for this event
-        template = next((t for t in templates if t.get('id') == event.get('template_id')), None)
+        template = templates_by_id.get(event.get('template_id'))
         if template and not template.get('active'):
             template = None
         
@@ -856,8 +1605,8 @@ def event_register(event_id):
                              submit_endpoint=submit_endpoint,
                              registration_closed=registration_closed,
                              deadline_passed=deadline_passed,
-                             club_info=CLUB_INFO,
-                             contact=CLUB_INFO)
+                             club_info=snap.club_info,
+                             contact=snap.club_info)
     except Exception as e:
         flash('Registration form not available at this time.', 'error')
         return redirect(url_for('event_detail', event_id=event_id))
@@ -881,19 +1630,16 @@ def api_register_event(event_slug):
             }), 400
         
         # Validate submitter email format
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, submitter_email):
+        if not _EMAIL_RE.match(submitter_email):
             return jsonify({
                 'error': 'Invalid email format',
                 'details': 'Please provide a valid email address'
             }), 400
         
         # Validate email domain
-        email_domain = submitter_email.split('@')[1].lower()
-        if email_domain not in ALLOWED_EMAIL_DOMAINS:
-            allowed_domains_str = ', '.join(ALLOWED_EMAIL_DOMAINS)
+        if not is_allowed_email(submitter_email):
             return jsonify({
-                'error': f'Email domain not allowed. Please use one of: {allowed_domains_str}'
+                'error': f'Email domain not allowed. Please use one of: {ALLOWED_EMAIL_DOMAINS_TEXT}'
             }), 400
         
         # Validate form if template_id provided
@@ -905,16 +1651,15 @@ def api_register_event(event_slug):
             except (TypeError, ValueError):
                 return jsonify({'error': 'Invalid template id'}), 400
 
-            templates_file = os.path.join(PROJECT_ROOT, 'data', 'form_templates.json')
-            if os.path.exists(templates_file):
-                with open(templates_file, 'r') as f:
-                    templates = json.load(f)
-                template_definition = next((t for t in templates if t.get('id') == template_id_int), None)
+            template_definition = get_form_templates()[1].get(template_id_int)
 
         if template_definition:
             if not template_definition.get('active', False):
                 return jsonify({'error': 'Registration form is inactive'}), 400
 
+            # Strip submitted strings once for all the checks below
+            stripped = {k: v.strip() if isinstance(v, str) else v for k, v in data.items()}
+
             # NEW: Validate participants (if participant-based template)
             min_participants = template_definition.get('min_participants', 1)
             max_participants = template_definition.get('max_participants', 1)
@@ -928,67 +1673,49 @@ def api_register_event(event_slug):
                         'error': f'Number of participants must be between {min_participants} and {max_participants}'
                     }), 400
                 
-                # Collect and validate participant data
+                # Collect and validate participant data in one pass over the
+                # pre-stripped submission
+                get = stripped.get
                 participants = []
                 for i in range(1, num_participants + 1):
-                    participant_name = data.get(f'participant_{i}_name', '').strip()
-                    participant_roll = data.get(f'participant_{i}_roll', '').strip()
-                    participant_email = data.get(f'participant_{i}_email', '').strip()
-                    
+                    participant_name = get(f'participant_{i}_name') or ''
+                    participant_roll = get(f'participant_{i}_roll') or ''
+                    participant_email = get(f'participant_{i}_email') or ''
+
                     if not participant_name:
-                        return jsonify({
-                            'error': f'Participant {i} name is required'
-                        }), 400
-                    
-                    if not participant_roll:
-                        return jsonify({
-                            'error': f'Participant {i} roll number is required'
-                        }), 400
-                    
-                    if not participant_email:
-                        return jsonify({
-                            'error': f'Participant {i} email is required'
-                        }), 400
-                    
-                    # Validate email format
-                    if not re.match(email_pattern, participant_email):
-                        return jsonify({
-                            'error': f'Participant {i} has invalid email format'
-                        }), 400
-                    
-                    # Validate email domain
-                    p_email_domain = participant_email.split('@')[1].lower()
-                    if p_email_domain not in ALLOWED_EMAIL_DOMAINS:
-                        return jsonify({
-                            'error': f'Participant {i} email domain not allowed. Please use one of: {", ".join(ALLOWED_EMAIL_DOMAINS)}'
-                        }), 400
-                    
-                    participants.append({
-                        'name': participant_name,
-                        'roll_no': participant_roll,
-                        'email': participant_email
-                    })
-                
+                        error = f'Participant {i} name is required'
+                    elif not participant_roll:
+                        error = f'Participant {i} roll number is required'
+                    elif not participant_email:
+                        error = f'Participant {i} email is required'
+                    elif not _EMAIL_RE.match(participant_email):
+                        error = f'Participant {i} has invalid email format'
+                    elif not is_allowed_email(participant_email):
+                        error = f'Participant {i} email domain not allowed. Please use one of: {ALLOWED_EMAIL_DOMAINS_TEXT}'
+                    else:
+                        participants.append({
+                            'name': participant_name,
+                            'roll_no': participant_roll,
+                            'email': participant_email
+                        })
+                        continue
+                    return jsonify({'error': error}), 400
+
                 # Store participants array in registration data
                 data['participants'] = participants
                 data['num_participants'] = num_participants
             
-            # Validate custom fields (new structure)
-            custom_fields = template_definition.get('custom_fields', [])
-            missing_fields = []
-            for field in custom_fields:
-                if field.get('required'):
-                    field_name = field.get('name')
-                    if not field_name or not str(data.get(field_name, '')).strip():
-                        missing_fields.append(field.get('label') or field_name)
-            
-            # Also check legacy 'fields' structure for backward compatibility
-            legacy_fields = template_definition.get('fields', [])
-            for field in legacy_fields:
-                if field.get('required'):
-                    field_name = field.get('name')
-                    if not field_name or not str(data.get(field_name, '')).strip():
-                        missing_fields.append(field.get('label') or field_name)
+            # Required fields from the new 'custom_fields' and legacy 'fields'
+            # structures are checked together
+            required = {
+                field.get('name'): field.get('label') or field.get('name')
+                for field in template_definition.get('custom_fields', []) + template_definition.get('fields', [])
+                if field.get('required')
+            }
+            missing_fields = [
+                label for name, label in required.items()
+                if not name or stripped.get(name, '') == ''
+            ]
 
             if missing_fields:
                 return jsonify({
@@ -1000,42 +1727,37 @@ def api_register_event(event_slug):
             for field in template_definition.get('fields', []):
                 if field.get('type') == 'email':
                     field_name = field.get('name')
-                    email_value = data.get(field_name, '').strip()
+                    email_value = stripped.get(field_name, '')
                     
                     if email_value:
                         # Basic email format validation
-                        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-                        if not re.match(email_pattern, email_value):
+                        if not _EMAIL_RE.match(email_value):
                             return jsonify({
                                 'error': f'Invalid email format for {field.get("label", field_name)}'
                             }), 400
                         
                         # Domain validation
-                        email_domain = email_value.split('@')[1].lower()
-                        if email_domain not in ALLOWED_EMAIL_DOMAINS:
-                            allowed_domains_str = ', '.join(ALLOWED_EMAIL_DOMAINS)
+                        if not is_allowed_email(email_value):
                             return jsonify({
-                                'error': f'Email domain not allowed. Please use one of: {allowed_domains_str}'
+                                'error': f'Email domain not allowed. Please use one of: {ALLOWED_EMAIL_DOMAINS_TEXT}'
                             }), 400
 
         # Validate event and registration deadline
         event_id = data.get('event_id')
         event = None
-        events = None  # Will hold the events list for saving
-        next_id = None  # Will hold the next_id for saving
         
+        # Look the event up in the shared snapshot (read-only); events.json is
+        # only loaded for writing if the event still needs a registration file
+        events_list = load_events()
         if event_id is not None:
             try:
-                event_id_int = int(event_id)
-                events, next_id = load_events_file()
-                event = next((e for e in events if e.get('id') == event_id_int), None)
+                event = get_event_by_id(events_list, int(event_id))
             except (TypeError, ValueError):
                 pass
         
         # If no event found by ID, try to find by slug
         if not event:
-            events, next_id = load_events_file()
-            event = next((e for e in events if slugify(e.get('name', '')) == event_slug), None)
+            event = get_event_by_slug(events_list, event_slug)
         
         if event:
             # Block registration for hidden events
@@ -1057,10 +1779,10 @@ def api_register_event(event_slug):
                     deadline_date = deadline_info['date']
                     # Skip validation for TBA deadlines
                     if deadline_date.upper() != 'TBA':
-                        deadline = datetime.strptime(deadline_date, '%Y-%m-%d')
+                        deadline = date.fromisoformat(deadline_date)
                         # Registration closes after the deadline day (deadline day is last day to register)
                         # Using IST for comparison
-                        if deadline.date() < get_ist_now().date():
+                        if deadline < get_ist_today():
                             return jsonify({'error': 'Registration deadline has passed'}), 400
                 except ValueError:
                     pass
@@ -1084,13 +1806,13 @@ def api_register_event(event_slug):
             logger.debug(f"Creating new registration file: {reg_file}")
             
             # Update event with registration file path
-            if event and next_id is not None:
-                event['registration_file'] = f'data/registrations/{reg_filename}'
-                # Save events.json with the updated event using save_events_file
-                save_events_file(events, next_id)
-                # Reload global EVENTS
-                global EVENTS
-                EVENTS = events
+            if event:
+                events, next_id = load_events_file()
+                stored_event = next((e for e in events if e.get('id') == event.get('id')), None)
+                if stored_event is not None:
+                    stored_event['registration_file'] = f'data/registrations/{reg_filename}'
+                    # Save events.json with the updated event using save_events_file
+                    save_events_file(events, next_id)
         
         # NOTE: Duplicate checking is done ONLY in atomic_add_registration to prevent race conditions.
         # Previously there was an early check here, but it caused timing issues where:
@@ -1111,34 +1833,25 @@ def api_register_event(event_slug):
         # Generate QR code for registration with admin verification URL
         event_name = event.get('name', 'Event') if event else 'Event'
         event_id_param = event.get('id', '') if event else ''
-        qr_url = f"{request.host_url}admin/verify-entry?regid={registration_uuid}&email={data.get('submitter_email', '')}&event_id={event_id_param}"
-        qr_code_base64 = generate_qr_code(qr_url)
-        
-        if qr_code_base64:
-            data['qr_code'] = qr_code_base64
+        qr_url = registration_qr_url(registration_uuid, data.get('submitter_email', ''), event_id_param)
+        # Free registrations render it on the executor while the checks below run;
+        # paid ones return early and get theirs in payment_verify
+        payment_required = bool(template_definition and template_definition.get('payment_enabled')
+                                and template_definition.get('payment_amount', 0) > 0)
+        qr_future = None if payment_required else EXECUTOR.submit(generate_qr_code, qr_url)
         
         # Define duplicate check function for atomic operation
-        def check_duplicates(registrations, new_reg):
+        unique_email_fields = get_template_unique_email_fields(template_definition.get('id')) if template_definition else ()
+        def check_duplicates(index, new_reg):
             submitter_email = new_reg.get('submitter_email', '').strip().lower()
-            if submitter_email:
-                for reg in registrations:
-                    existing_email = reg.get('submitter_email', '').strip().lower()
-                    if existing_email == submitter_email:
-                        return f'Email already registered: {submitter_email}'
+            if index.has('submitter_email', submitter_email, fold=True):
+                return f'Email already registered: {submitter_email}'
             
-            # Check other unique fields from template
-            if template_definition:
-                for field in template_definition.get('fields', []):
-                    if field.get('type') == 'email' and field.get('unique', False):
-                        field_name = field.get('name')
-                        if field_name == 'submitter_email':
-                            continue
-                        email_value = new_reg.get(field_name, '').strip().lower()
-                        if email_value:
-                            for reg in registrations:
-                                existing_email = reg.get(field_name, '').strip().lower()
-                                if existing_email == email_value:
-                                    return f'{field.get("label", field_name)} already registered: {email_value}'
+            # Check other unique fields from template (filtered when templates were loaded)
+            for field_name, label in unique_email_fields:
+                email_value = new_reg.get(field_name, '').strip().lower()
+                if index.has(field_name, email_value, fold=True):
+                    return f'{label} already registered: {email_value}'
             return None  # No duplicates found
         
         # Check if payment is required
@@ -1156,7 +1869,7 @@ def api_register_event(event_slug):
                         }), 400
                     
                     # BUG FIX: Use registration_uuid instead of data['id'] which isn't set yet
-                    order_id = f"ORD_{event_slug}_{registration_uuid[:8]}_{int(time.time())}"
+                    order_id = f"ORD_{event_slug}_{registration_uuid[:8]}_{next(_ORDER_COUNTER)}"
                     payment_order = create_razorpay_order(
                         order_id=order_id,
                         amount=payment_amount,
@@ -1210,6 +1923,11 @@ def api_register_event(event_slug):
         logger.debug(f"Saving registration to: {reg_file}")
         logger.debug(f"Registration ID being saved: {registration_uuid}")
         
+        # QR code was started on the executor above. Saved under
+        # data/registrations/qr and returned as base64; the email attaches the raw PNG.
+        qr_png = _await_qr(qr_future, data)
+        qr_code_base64 = base64.b64encode(qr_png).decode() if qr_png else None
+        
         success, error_msg, _ = atomic_add_registration(reg_file, data, check_duplicates)
         
         if not success:
@@ -1219,22 +1937,27 @@ def api_register_event(event_slug):
             }), 400
         
         logger.debug(f"Registration saved successfully with ID: {registration_uuid}")
+        if data.get('qr_code_path'):
+            save_registration_qr(data['qr_code_path'], qr_png)
         
         # Send confirmation email with QR code (use the SAME registration_uuid that was saved)
+        # (queued on the background executor; SMTP failures are logged there)
         email_sent = False
-        if qr_code_base64:
-            email_sent = send_registration_email(
+        if qr_png:
+            submit_background(
+                send_registration_email,
                 email=data.get('submitter_email'),
                 registration_id=registration_uuid,  # Use the exact same UUID that was saved
-                qr_code_base64=qr_code_base64,
+                qr_png=qr_png,
                 event_name=event_name,
                 registration_data=data
             )
+            email_sent = True
         
         # Return the SAME registration_uuid that was saved to DB and sent in email
         return jsonify({
             'success': True,
-            'message': 'Registration submitted successfully!' + (' Confirmation email sent.' if email_sent else ''),
+            'message': 'Registration submitted successfully!' + (' Confirmation email is on its way.' if email_sent else ''),
             'registration_id': registration_uuid,  # This must match what's in DB
             'email_sent': email_sent,
             'qr_code': qr_code_base64
@@ -1264,28 +1987,36 @@ def payment_verify():
         
         # STEP 1: SERVER-SIDE SIGNATURE VERIFICATION
         # This is critical security step - never trust client-side verification alone
-        # hmac and hashlib are imported at module level
         
-        _, key_secret = get_razorpay_keys()
+        key_id, key_secret = get_razorpay_keys()
         message = f"{razorpay_order_id}|{razorpay_payment_id}"
-        expected_signature = hmac.new(
-            key_secret.encode(),
-            message.encode(),
-            hashlib.sha256
-        ).hexdigest()
         
-        if expected_signature != razorpay_signature:
+        if not verify_razorpay_signature(message, razorpay_signature, key_secret):
             # Log failed verification attempt
             logger.warning(f"Payment verification failed for order {razorpay_order_id}")
             return jsonify({'error': 'Invalid payment signature'}), 400
         
+        # The registration_id should already be in registration_data from the initial form submission
+        if 'registration_id' not in registration_data or not registration_data['registration_id']:
+            registration_uuid = str(uuid.uuid4())
+            registration_data['registration_id'] = registration_uuid
+            logger.warning(f"registration_id was missing, generated new one: {registration_uuid}")
+        else:
+            registration_uuid = registration_data['registration_id']
+            logger.debug(f"Using existing registration_id: {registration_uuid}")
+        
+        # Render the QR code on the executor while we wait on Razorpay below;
+        # always generated here rather than trusting one sent by the client
+        event_id_param = registration_data.get('event_id', '')
+        qr_url = registration_qr_url(registration_uuid, registration_data.get('submitter_email', ''), event_id_param)
+        qr_future = EXECUTOR.submit(generate_qr_code, qr_url)
+        
         # STEP 2: ADDITIONAL SERVER-SIDE CHECK - Verify payment status with Razorpay API
         # This prevents replay attacks and ensures payment is actually captured
         try:
             verify_url = f"https://api.razorpay.com/v1/payments/{razorpay_payment_id}"
-            key_id, key_secret = get_razorpay_keys()
             auth = (key_id, key_secret)
-            response = requests.get(verify_url, auth=auth)
+            response = HTTP.get(verify_url, auth=auth, timeout=RAZORPAY_TIMEOUT)
             
             if response.status_code == 200:
                 payment_details = response.json()
@@ -1340,43 +2071,27 @@ def payment_verify():
         # Get event name for email
         event_name = 'Event'
         try:
-            _, events, _, _ = load_data()
+            events = load_events()
             event_id = registration_data.get('event_id')
             if event_id:
-                event = next((e for e in events if e.get('id') == int(event_id)), None)
+                event = get_event_by_id(events, int(event_id))
                 if event:
                     event_name = event.get('name', 'Event')
         except:
             pass
         
-        # The registration_id should already be in registration_data from the initial form submission
-        if 'registration_id' not in registration_data or not registration_data['registration_id']:
-            registration_uuid = str(uuid.uuid4())
-            registration_data['registration_id'] = registration_uuid
-            logger.warning(f"registration_id was missing, generated new one: {registration_uuid}")
-        else:
-            registration_uuid = registration_data['registration_id']
-            logger.debug(f"Using existing registration_id: {registration_uuid}")
-        
-        # Generate QR code if not present
-        if 'qr_code' not in registration_data or not registration_data['qr_code']:
-            event_id_param = registration_data.get('event_id', '')
-            qr_url = f"{request.host_url}admin/verify-entry?regid={registration_uuid}&email={registration_data.get('submitter_email', '')}&event_id={event_id_param}"
-            qr_code_base64 = generate_qr_code(qr_url)
-            if qr_code_base64:
-                registration_data['qr_code'] = qr_code_base64
-        else:
-            qr_code_base64 = registration_data['qr_code']
+        # QR code was started on the executor before the Razorpay check
+        qr_png = _await_qr(qr_future, registration_data)
+        qr_code_base64 = base64.b64encode(qr_png).decode() if qr_png else None
         
         # Define duplicate check function for payment registration
-        def check_payment_duplicates(registrations, new_reg):
+        def check_payment_duplicates(index, new_reg):
             # Check for duplicate payment ID
-            for reg in registrations:
-                if reg.get('payment_id') == razorpay_payment_id:
-                    return f'Payment already processed'
-                # Also check for duplicate email
-                if reg.get('submitter_email', '').lower() == new_reg.get('submitter_email', '').lower():
-                    return f'Email already registered'
+            if index.has('payment_id', razorpay_payment_id):
+                return f'Payment already processed'
+            # Also check for duplicate email
+            if index.has('submitter_email', new_reg.get('submitter_email', ''), fold=True):
+                return f'Email already registered'
             return None
         
         # Save registration using ATOMIC operation
@@ -1392,21 +2107,27 @@ def payment_verify():
             }), 400
         
         logger.debug(f"Payment registration saved successfully with ID: {registration_uuid}")
+        record_order_registration(razorpay_order_id, reg_file)
+        if registration_data.get('qr_code_path'):
+            save_registration_qr(registration_data['qr_code_path'], qr_png)
         
         # Send confirmation email with QR code (use the SAME registration_uuid that was saved)
+        # (queued on the background executor; SMTP failures are logged there)
         email_sent = False
-        if qr_code_base64:
-            email_sent = send_registration_email(
+        if qr_png:
+            submit_background(
+                send_registration_email,
                 email=registration_data.get('submitter_email'),
                 registration_id=registration_uuid,  # Use the exact same UUID that was saved
-                qr_code_base64=qr_code_base64,
+                qr_png=qr_png,
                 event_name=event_name,
                 registration_data=registration_data
             )
+            email_sent = True
         
         return jsonify({
             'success': True,
-            'message': 'Payment verified and registration completed!' + (' Confirmation email sent.' if email_sent else ''),
+            'message': 'Payment verified and registration completed!' + (' Confirmation email is on its way.' if email_sent else ''),
             'registration_id': registration_uuid,
             'email_sent': email_sent,
             'qr_code': qr_code_base64
@@ -1417,33 +2138,162 @@ def payment_verify():
         return jsonify({'error': 'Payment verification failed'}), 500
 
 
+# Razorpay order id -> project-relative registrations file holding it, so a
+# webhook opens one file instead of scanning every event's registrations
+ORDER_INDEX_FILE = os.path.join(PROJECT_ROOT, 'data', 'indexes', 'order_id_index.json')
+
+# (registrations dir st_mtime_ns, tuple of *_registrations.json paths)
+_registration_files_cache = None
+
+def _registration_files():
+    """Paths of all registrations files, re-listed only when the directory changes"""
+    global _registration_files_cache
+    registrations_dir = os.path.join(PROJECT_ROOT, 'data', 'registrations')
+    try:
+        mtime = os.stat(registrations_dir).st_mtime_ns
+    except FileNotFoundError:
+        return ()
+    cache = _registration_files_cache
+    if cache is None or cache[0] != mtime:
+        with os.scandir(registrations_dir) as entries:
+            files = tuple(entry.path for entry in entries if entry.name.endswith('_registrations.json'))
+        cache = _registration_files_cache = (mtime, files)
+    return cache[1]
+
+def _order_ids_in_file(filepath):
+    """Payment order ids in a registrations file, parsing only records that can hold one"""
+    with get_file_rwlock(filepath).read():
+        try:
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return []
+    if b'"payment_order_id"' not in raw:
+        return []  # no paid registrations: nothing to parse
+    try:
+        if raw.lstrip()[:1] == b'[':
+            registrations = json_loads(raw)
+        else:
+            registrations = [json_loads(line) for line in raw.splitlines() if b'"payment_order_id"' in line]
+    except JSONDecodeError:
+        registrations = read_registrations(filepath)  # recovers from the backup
+    return [reg['payment_order_id'] for reg in registrations if reg.get('payment_order_id')]
+
+def _load_order_index_no_lock():
+    """Read the order index, rebuilding it from the registrations files if missing (caller holds the write lock)"""
+    try:
+        with open(ORDER_INDEX_FILE, 'rb') as f:
+            return json_loads(f.read())
+    except FileNotFoundError:
+        pass
+    except (JSONDecodeError, IOError) as e:
+        logger.error(f"Failed to read order index, rebuilding: {e}")
+    # Read and parse the files concurrently on the executor; threads overlap
+    # the disk reads
+    order_index = {}
+    filepaths = _registration_files()
+    for filepath, orders in zip(filepaths, EXECUTOR.map(_order_ids_in_file, filepaths)):
+        relpath = os.path.relpath(filepath, PROJECT_ROOT).replace(os.sep, '/')
+        order_index.update(dict.fromkeys(orders, relpath))
+    _write_json_no_lock(ORDER_INDEX_FILE, order_index)
+    return order_index
+
+@contextmanager
+def _order_index_lock():
+    """Exclusive access to the order index for this thread and, where fcntl
+    exists, across worker processes (gunicorn -w N), which each rewrite the
+    whole file"""
+    with get_file_rwlock(ORDER_INDEX_FILE).write():
+        if fcntl is None:
+            yield
+            return
+        os.makedirs(os.path.dirname(ORDER_INDEX_FILE), exist_ok=True)
+        with open(ORDER_INDEX_FILE + '.lock', 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+def record_order_registration(order_id, reg_file):
+    """Point order_id at the registrations file it was saved to"""
+    if not order_id:
+        return
+    try:
+        with _order_index_lock():
+            order_index = _load_order_index_no_lock()
+            order_index[order_id] = os.path.relpath(reg_file, PROJECT_ROOT).replace(os.sep, '/')
+            _write_json_no_lock(ORDER_INDEX_FILE, order_index)
+    except Exception as e:
+        logger.error(f"Failed to update order index for {order_id}: {e}")
+
+def update_order_registration(order_id, updates):
+    """Apply updates to the registration paid with order_id; True if one was found"""
+    if not order_id:
+        return False
+    with _order_index_lock():
+        relpath = _load_order_index_no_lock().get(order_id)
+    if relpath and _update_order_in_file(os.path.join(PROJECT_ROOT, relpath), order_id, updates):
+        return True
+    
+    # Index miss (entry lost, or the file changed under it): scan the
+    # registrations files so a payment update is never silently dropped
+    logger.warning(f"Order {order_id} not found through the order index, scanning registrations")
+    for filepath in _registration_files():
+        if order_id in _order_ids_in_file(filepath) and _update_order_in_file(filepath, order_id, updates):
+            record_order_registration(order_id, filepath)
+            return True
+    return False
+
+def _update_order_in_file(filepath, order_id, updates):
+    """Apply updates to the registration in filepath paid with order_id; True if found"""
+    with get_file_rwlock(filepath).write():
+        try:
+            with open(filepath, 'rb') as f:
+                registrations = _parse_registrations(f.read())
+        except (FileNotFoundError, JSONDecodeError) as e:
+            logger.error(f"Order {order_id}: unreadable registrations file {filepath}: {e}")
+            return False
+        reg = next((r for r in registrations if r.get('payment_order_id') == order_id), None)
+        if reg is None:
+            return False
+        reg.update(updates)
+        _write_bytes_no_lock(filepath, _registrations_jsonl(registrations))
+        _registrations_cache.pop(filepath, None)
+    return True
+
+WEBHOOK_MAX_BODY = 64 * 1024
+
 @app.route('/payment/webhook', methods=['POST'])
 def payment_webhook():
     """Handle Razorpay webhook for payment notifications (Server-side)"""
     try:
         # Get webhook data - SECURITY: Use environment variable for webhook secret
-        webhook_secret = os.environ.get('RAZORPAY_WEBHOOK_SECRET')
+        webhook_secret = razorpay_webhook_secret()
         if not webhook_secret:
             logger.error("RAZORPAY_WEBHOOK_SECRET not configured")
             return jsonify({'error': 'Webhook not configured'}), 500
         
+        # Nothing is read, hashed or parsed for unsigned or oversized requests;
+        # Razorpay webhook payloads are a few KB
         webhook_signature = request.headers.get('X-Razorpay-Signature')
-        webhook_body = request.get_data()
-        
-        # Verify webhook signature (Server-side verification)
-        # hmac and hashlib are imported at module level
-        expected_signature = hmac.new(
-            webhook_secret.encode(),
-            webhook_body,
-            hashlib.sha256
-        ).hexdigest()
-        
-        if webhook_signature != expected_signature:
+        if not webhook_signature:
+            return jsonify({'error': 'Missing signature'}), 401
+        if request.content_length and request.content_length > WEBHOOK_MAX_BODY:
+            return jsonify({'error': 'Payload too large'}), 413
+        
+        # Bounded read: the cap also holds for chunked bodies without a length
+        webhook_body = request.stream.read(WEBHOOK_MAX_BODY + 1)
+        if len(webhook_body) > WEBHOOK_MAX_BODY:
+            return jsonify({'error': 'Payload too large'}), 413
+        
+        # Verify webhook signature (Server-side verification) before any file I/O
+        if not verify_webhook_signature(webhook_body, webhook_signature, webhook_secret):
             logger.warning("Webhook signature verification failed")
-            return jsonify({'error': 'Invalid signature'}), 400
+            return jsonify({'error': 'Invalid signature'}), 401
         
-        # Process webhook event
-        event = request.get_json()
+        # Process webhook event (parsed once, from the bytes that were verified)
+        event = json_loads(webhook_body)
         event_type = event.get('event')
         
         if event_type == 'payment.captured':
@@ -1456,23 +2306,12 @@ def payment_webhook():
             logger.info(f"Payment captured: {payment_id} for order: {order_id}")
             
             # Find and update registration
-            registrations_dir = os.path.join(PROJECT_ROOT, 'data', 'registrations')
-            if os.path.exists(registrations_dir):
-                for filename in os.listdir(registrations_dir):
-                    if filename.endswith('_registrations.json'):
-                        filepath = os.path.join(registrations_dir, filename)
-                        registrations = safe_json_read(filepath)
-                        
-                        for reg in registrations:
-                            if reg.get('payment_order_id') == order_id:
-                                reg['payment_status'] = 'completed'
-                                reg['payment_id'] = payment_id
-                                reg['payment_completed_at'] = datetime.now().isoformat()
-                                reg['webhook_verified'] = True
-                                
-                                safe_json_write(filepath, registrations)
-                                
-                                return jsonify({'status': 'ok'}), 200
+            update_order_registration(order_id, {
+                'payment_status': 'completed',
+                'payment_id': payment_id,
+                'payment_completed_at': datetime.now().isoformat(),
+                'webhook_verified': True,
+            })
         
         elif event_type == 'payment.failed':
             # Payment failed - update status
@@ -1482,21 +2321,10 @@ def payment_webhook():
             logger.warning(f"Payment failed for order: {order_id}")
             
             # Update registration status
-            registrations_dir = os.path.join(PROJECT_ROOT, 'data', 'registrations')
-            if os.path.exists(registrations_dir):
-                for filename in os.listdir(registrations_dir):
-                    if filename.endswith('_registrations.json'):
-                        filepath = os.path.join(registrations_dir, filename)
-                        registrations = safe_json_read(filepath)
-                        
-                        for reg in registrations:
-                            if reg.get('payment_order_id') == order_id:
-                                reg['payment_status'] = 'failed'
-                                reg['payment_failed_at'] = datetime.now().isoformat()
-                                
-                                safe_json_write(filepath, registrations)
-                                
-                                return jsonify({'status': 'ok'}), 200
+            update_order_registration(order_id, {
+                'payment_status': 'failed',
+                'payment_failed_at': datetime.now().isoformat(),
+            })
         
         return jsonify({'status': 'ok'}), 200
         
@@ -1513,7 +2341,7 @@ def payment_status(order_id):
         verify_url = f"https://api.razorpay.com/v1/orders/{order_id}"
         key_id, key_secret = get_razorpay_keys()
         auth = (key_id, key_secret)
-        response = requests.get(verify_url, auth=auth)
+        response = HTTP.get(verify_url, auth=auth, timeout=RAZORPAY_TIMEOUT)
         
         if response.status_code == 200:
             order_details = response.json()
@@ -1546,16 +2374,10 @@ def payment_callback():
     
     # Verify signature on server
     try:
-        # hmac and hashlib are imported at module level
         _, key_secret = get_razorpay_keys()
-        message = f"{order_id}|{payment_id}"
-        expected_signature = hmac.new(
-            key_secret.encode(),
-            message.encode(),
-            hashlib.sha256
-        ).hexdigest()
-        
-        if signature == expected_signature:
+        message = order_id.encode() + b'|' + payment_id.encode()
+        
+        if verify_razorpay_signature(message, signature, key_secret):
             flash('Payment successful! Your registration is confirmed.', 'success')
         else:
             flash('Payment verification failed. Please contact support.', 'error')
@@ -1569,75 +2391,112 @@ def payment_callback():
 @app.route('/members')
 def members():
     """Members page showing team members"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+    snap = load_data()
     return render_template('members.html', 
-                         members=MEMBERS,
-                         club_info=CLUB_INFO,
-                         contact=CLUB_INFO)
+                         members=snap.members,
+                         club_info=snap.club_info,
+                         contact=snap.club_info)
 
 @app.route('/gallery')
 def gallery():
     """Life @ AICC gallery page"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+    snap = load_data()
     return render_template('gallery.html', 
-                         gallery=GALLERY,
-                         club_info=CLUB_INFO,
-                         contact=CLUB_INFO)
+                         gallery=snap.gallery,
+                         club_info=snap.club_info,
+                         contact=snap.club_info)
+
+# Serialized public API responses: name -> (source objects, body bytes, etag)
+_json_responses = {}
+
+def cached_json_response(name, sources, build):
+    """JSON response for build(), re-serialized only when a source object changes
+
+    sources are compared by identity (load_data and get_form_templates hand
+    out new objects when a file changes). Browsers revalidate every time, so
+    admin edits show up at once, and get a bodiless 304 while the ETag matches.
+    """
+    cached = _json_responses.get(name)
+    if cached is None or any(old is not new for old, new in zip(cached[0], sources)):
+        body = app.json.dumps(build()).encode()
+        cached = _json_responses[name] = (sources, body, hashlib.blake2b(body, digest_size=16).hexdigest())
+    response = app.response_class(cached[1], mimetype='application/json')
+    response.set_etag(cached[2])
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
 
 @app.route('/api/events')
 def api_events():
     """API endpoint to get events data"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
-    return jsonify(EVENTS)
+    events = load_events()
+    return cached_json_response('events', (events,), lambda: events)
 
 
 @app.route('/api/members')
 def api_members():
     """API endpoint to get members data"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
-    return jsonify(MEMBERS)
+    snap = load_data()
+    return cached_json_response('members', (snap.members,), lambda: snap.members)
 
 @app.route('/api/data')
 def api_data():
     """Bulk API endpoint: returns ALL public data in a single response.
     Used by the React frontend to minimize API calls (CPU-saving for PythonAnywhere free tier).
     """
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
-    
-    # Strip sensitive fields from club info
-    sensitive_keys = {'api_config', 'email_config', 'admin_password'}
-    safe_club_info = {k: v for k, v in CLUB_INFO.items() if k not in sensitive_keys}
+    snap = load_data()
     
-    # Load form templates (active only)
-    templates_file = os.path.join(PROJECT_ROOT, 'data', 'form_templates.json')
-    form_templates = []
-    if os.path.exists(templates_file):
-        try:
-            with open(templates_file, 'r') as f:
-                all_templates = json.load(f)
-            form_templates = [t for t in all_templates if t.get('active')]
-        except Exception:
-            form_templates = []
+    # Load form templates
+    try:
+        templates = get_form_templates()[0]
+    except Exception:
+        templates = []
+    
+    def build():
+        # Strip sensitive fields from club info
+        sensitive_keys = {'api_config', 'email_config', 'admin_password'}
+        safe_club_info = {k: v for k, v in snap.club_info.items() if k not in sensitive_keys}
+        return {
+            'club': safe_club_info,
+            'events': snap.events,
+            'members': snap.members,
+            'gallery': snap.gallery,
+            'form_templates': [t for t in templates if t.get('active')]  # active only
+        }
     
-    return jsonify({
-        'club': safe_club_info,
-        'events': EVENTS,
-        'members': MEMBERS,
-        'gallery': GALLERY,
-        'form_templates': form_templates
-    })
+    return cached_json_response('data', (snap, templates), build)
+
+# Attendance lookups per registrations file:
+# filepath -> ((st_mtime_ns, st_size), {(registration_id, email_lower): registration}, count).
+# The registrations are shared between requests and must not be modified.
+_attendance_index = {}
+
+def find_attendance_registration(event, reg_id, email):
+    """Return (registration or None, total registrations) for an event's attendance lookup
+
+    email must already be lowercased.
+    """
+    if event.get('registration_file'):
+        reg_file_path = os.path.join(PROJECT_ROOT, event['registration_file'])
+    else:
+        event_slug = slugify(event.get('name', ''))
+        reg_file_path = os.path.join(PROJECT_ROOT, 'data', 'registrations', f'{event_slug}_registrations.json')
+    try:
+        st = os.stat(reg_file_path)
+    except FileNotFoundError:
+        return None, 0
+    key = (st.st_mtime_ns, st.st_size)
+    cached = _attendance_index.get(reg_file_path)
+    if cached is None or cached[0] != key:
+        registrations = read_registrations(reg_file_path)
+        lookup = {}
+        for reg in registrations:
+            lookup.setdefault((reg.get('registration_id'), reg.get('submitter_email', '').lower()), reg)
+        cached = _attendance_index[reg_file_path] = (key, lookup, len(registrations))
+    return cached[1].get((reg_id, email)), cached[2]
 
 @app.route('/api/attendance/check', methods=['POST'])
 def api_attendance_check():
     """JSON-only attendance check API for the React frontend."""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
-    
     data = request.get_json(silent=True) or {}
     email = data.get('email', '').strip().lower()
     reg_id = data.get('registration_id', '').strip()
@@ -1648,31 +2507,13 @@ def api_attendance_check():
     
     try:
         event_id = int(event_id)
-        event = next((e for e in EVENTS if e.get('id') == event_id), None)
+        event = get_event_by_id(load_events(), event_id)
         
         if not event:
             return jsonify({'error': 'Event not found.'}), 404
         
-        # Load registrations for this event
-        registrations = []
-        if event.get('registration_file'):
-            reg_file_path = os.path.join(PROJECT_ROOT, event['registration_file'])
-            if os.path.exists(reg_file_path):
-                with open(reg_file_path, 'r') as f:
-                    registrations = json.load(f)
-        else:
-            event_slug = slugify(event.get('name', ''))
-            reg_file_path = os.path.join(PROJECT_ROOT, 'data', 'registrations', f'{event_slug}_registrations.json')
-            if os.path.exists(reg_file_path):
-                with open(reg_file_path, 'r') as f:
-                    registrations = json.load(f)
-        
-        # Find the registration
-        registration = None
-        for reg in registrations:
-            if reg.get('registration_id') == reg_id and reg.get('submitter_email', '').lower() == email:
-                registration = reg
-                break
+        # Find the registration through the per-file lookup index
+        registration, _ = find_attendance_registration(event, reg_id, email)
         
         if not registration:
             return jsonify({'error': 'Registration not found. Please check your email and registration ID.'}), 404
@@ -1723,8 +2564,7 @@ def attendance_check():
     
     Example: /attendance/check?event_id=1&email=test@example.com&rid=66446360-a634-4179-904f-c77100275e76
     """
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+    snap = load_data()
     
     attendance_info = None
     error_message = None
@@ -1744,33 +2584,13 @@ def attendance_check():
     if email and reg_id and event_id:
         try:
             event_id = int(event_id)
-            event = next((e for e in EVENTS if e.get('id') == event_id), None)
+            event = get_event_by_id(snap.events, event_id)
             
             if not event:
                 error_message = 'Event not found.'
             else:
-                # Load registrations for this event
-                registrations = []
-                reg_file_path = None
-                
-                if event.get('registration_file'):
-                    reg_file_path = os.path.join(PROJECT_ROOT, event['registration_file'])
-                    if os.path.exists(reg_file_path):
-                        with open(reg_file_path, 'r') as f:
-                            registrations = json.load(f)
-                else:
-                    event_slug = slugify(event.get('name', ''))
-                    reg_file_path = os.path.join(PROJECT_ROOT, 'data', 'registrations', f'{event_slug}_registrations.json')
-                    if os.path.exists(reg_file_path):
-                        with open(reg_file_path, 'r') as f:
-                            registrations = json.load(f)
-                
-                # Find the registration
-                registration = None
-                for reg in registrations:
-                    if reg.get('registration_id') == reg_id and reg.get('submitter_email', '').lower() == email:
-                        registration = reg
-                        break
+                # Find the registration through the per-file lookup index
+                registration, total_registrations = find_attendance_registration(event, reg_id, email)
                 
                 if not registration:
                     error_message = 'Registration not found. Please check your email and registration ID.'
@@ -1783,7 +2603,7 @@ def attendance_check():
                         'entry_time': registration.get('entry_time'),
                         'attendance_comment': registration.get('attendance_comment', ''),
                         'marked_by': registration.get('marked_by', ''),
-                        'total_registrations': len(registrations)
+                        'total_registrations': total_registrations
                     }
         except (ValueError, TypeError):
             error_message = 'Invalid event selection.'
@@ -1801,25 +2621,13 @@ def attendance_check():
                                   rid=attendance_info['registration']['registration_id'],
                                   _external=True)
         
-        # Generate QR code for the shareable link
-        try:
-            qr = qrcode.QRCode(version=1, box_size=10, border=4)
-            qr.add_data(shareable_link)
-            qr.make(fit=True)
-            qr_img = qr.make_image(fill_color="black", back_color="white")
-            
-            # Convert to base64
-            buffered = io.BytesIO()
-            qr_img.save(buffered, format="PNG")
-            shareable_qr_code = base64.b64encode(buffered.getvalue()).decode('utf-8')
-        except Exception as e:
-            logging.error(f"Error generating shareable QR code: {e}")
-            shareable_qr_code = None
+        # QR code for the shareable link (same link, same image: cached)
+        shareable_qr_code = shareable_qr_base64(shareable_link)
     
     return render_template('attendance_check.html',
-                         club_info=CLUB_INFO,
-                         contact=CLUB_INFO,
-                         events=EVENTS,
+                         club_info=snap.club_info,
+                         contact=snap.club_info,
+                         events=snap.events,
                          attendance_info=attendance_info,
                          error_message=error_message,
                          shareable_link=shareable_link,
@@ -1832,26 +2640,48 @@ def attendance_check():
 import secrets
 
 # In-memory admin tokens (simple approach - token -> expiry timestamp)
+# Admin API tokens: _admin_token_key(token) -> expiry (epoch seconds). Guarded
+# by one lock so concurrent logins and checks under a threaded server can't
+# race the sweep.
 _admin_tokens = {}
+_admin_tokens_lock = threading.Lock()
+_MAX_ADMIN_TOKENS = 1024  # sweep expired tokens only once there are this many
 
 def _cleanup_tokens():
-    """Remove expired tokens"""
+    """Remove expired tokens (caller holds _admin_tokens_lock)"""
     now = time.time()
     expired = [t for t, exp in _admin_tokens.items() if exp < now]
     for t in expired:
         del _admin_tokens[t]
 
+def _admin_token_key(token):
+    """16-byte blake2b digest a token is stored under
+
+    Lookups then compare digests rather than the bearer token itself, and
+    the map never holds usable tokens.
+    """
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
 def _generate_admin_token():
     """Generate a secure admin token valid for 24 hours"""
-    _cleanup_tokens()
     token = secrets.token_urlsafe(32)
-    _admin_tokens[token] = time.time() + 86400  # 24h
+    with _admin_tokens_lock:
+        if len(_admin_tokens) >= _MAX_ADMIN_TOKENS:
+            _cleanup_tokens()
+        _admin_tokens[_admin_token_key(token)] = time.time() + 86400  # 24h
     return token
 
 def _verify_admin_token(token):
-    """Verify an admin token is valid"""
-    _cleanup_tokens()
-    return token in _admin_tokens
+    """Verify an admin token is valid, dropping it if it has expired"""
+    key = _admin_token_key(token)
+    with _admin_tokens_lock:
+        exp = _admin_tokens.get(key)
+        if exp is None:
+            return False
+        if exp < time.time():
+            del _admin_tokens[key]
+            return False
+        return True
 
 def api_admin_required(f):
     """Decorator for API routes requiring admin token"""
@@ -1888,33 +2718,31 @@ def api_admin_verify():
 @api_admin_required
 def api_admin_dashboard():
     """Get dashboard stats"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+    snap = load_data()
     return jsonify({
-        'events_count': len(EVENTS),
-        'members_count': len(MEMBERS),
-        'gallery_count': len(GALLERY),
+        'events_count': len(snap.events),
+        'members_count': len(snap.members),
+        'gallery_count': len(snap.gallery),
     })
 
 @app.route('/api/admin/club-info', methods=['GET', 'PUT'])
 @api_admin_required
 def api_admin_club_info():
     """Get or update club information"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+    snap = load_data()
     
     if request.method == 'GET':
-        return jsonify(CLUB_INFO)
+        return jsonify(snap.club_info)
     
     # PUT - update
     data = request.get_json(silent=True) or {}
     # Merge with existing, preserving keys not in request
+    # (copy first: the snapshot is shared with concurrent readers)
+    club_info = dict(snap.club_info)
     for key in data:
-        CLUB_INFO[key] = data[key]
+        club_info[key] = data[key]
     
-    with open(os.path.join(PROJECT_ROOT, 'data/club_info.json'), 'w') as f:
-        json.dump(CLUB_INFO, f, indent=4)
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+    save_data_file('club_info.json', club_info)
     
     # Reconfigure Flask-Mail with new SMTP settings
     configure_mail()
@@ -1925,15 +2753,13 @@ def api_admin_club_info():
 @api_admin_required
 def api_admin_events():
     """Get all events for admin"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
-    return jsonify(EVENTS)
+    snap = load_data()
+    return jsonify(snap.events)
 
 @app.route('/api/admin/events', methods=['POST'])
 @api_admin_required
 def api_admin_create_event():
     """Create a new event via API"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
     data = request.get_json(silent=True) or {}
     
     events, next_id = load_events_file()
@@ -1962,29 +2788,19 @@ def api_admin_create_event():
     
     # Create registration file for internal registration
     if new_event['registration_type'] == 'internal' and new_event.get('template_id'):
-        event_slug = re.sub(r'[^a-z0-9]+', '_', new_event['name'].lower()).strip('_')
-        reg_filename = f"{event_slug}_{new_event['id']}_registrations.json"
-        reg_file_path = os.path.join(PROJECT_ROOT, 'data', 'registrations', reg_filename)
-        os.makedirs(os.path.dirname(reg_file_path), exist_ok=True)
-        if not os.path.exists(reg_file_path):
-            with open(reg_file_path, 'w') as f:
-                json.dump([], f)
-        new_event['registration_file'] = f'data/registrations/{reg_filename}'
+        create_registration_file(new_event)
     
     events.append(new_event)
     save_events_file(events, next_id + 1)
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
     return jsonify({'success': True, 'event': new_event})
 
 @app.route('/api/admin/events/<int:event_id>', methods=['PUT'])
 @api_admin_required
 def api_admin_update_event(event_id):
     """Update an event via API"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
     data = request.get_json(silent=True) or {}
     
-    events, next_id = load_events_file()
-    event = next((e for e in events if e.get('id') == event_id), None)
+    events, next_id, event = load_event_for_update(event_id)
     if not event:
         return jsonify({'error': 'Event not found'}), 404
     
@@ -1997,42 +2813,30 @@ def api_admin_update_event(event_id):
     
     # Create registration file if switching to internal
     if event.get('registration_type') == 'internal' and event.get('template_id') and not event.get('registration_file'):
-        event_slug = re.sub(r'[^a-z0-9]+', '_', event['name'].lower()).strip('_')
-        reg_filename = f"{event_slug}_{event['id']}_registrations.json"
-        reg_file_path = os.path.join(PROJECT_ROOT, 'data', 'registrations', reg_filename)
-        os.makedirs(os.path.dirname(reg_file_path), exist_ok=True)
-        if not os.path.exists(reg_file_path):
-            with open(reg_file_path, 'w') as f:
-                json.dump([], f)
-        event['registration_file'] = f'data/registrations/{reg_filename}'
+        create_registration_file(event)
     
     save_events_file(events, next_id)
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
     return jsonify({'success': True, 'event': event})
 
 @app.route('/api/admin/events/<int:event_id>', methods=['DELETE'])
 @api_admin_required
 def api_admin_delete_event(event_id):
     """Archive an event (mark as completed)"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    events, next_id = load_events_file()
-    event = next((e for e in events if e.get('id') == event_id), None)
+    events, next_id, event = load_event_for_update(event_id)
     if event:
         event['status'] = 'completed'
         event['registration_type'] = 'none'
         event['allow_registration'] = False
     save_events_file(events, next_id)
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
     return jsonify({'success': True})
 
 @app.route('/api/admin/events/<int:event_id>/registrations', methods=['GET'])
 @api_admin_required
 def api_admin_event_registrations(event_id):
     """Get registrations for an event"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+    snap = load_data()
     
-    event = next((e for e in EVENTS if e.get('id') == event_id), None)
+    event = get_event_by_id(snap.events, event_id)
     if not event:
         return jsonify({'error': 'Event not found'}), 404
     
@@ -2040,18 +2844,14 @@ def api_admin_event_registrations(event_id):
     if event.get('registration_file'):
         reg_file = os.path.join(PROJECT_ROOT, event['registration_file'])
         if os.path.exists(reg_file):
-            with open(reg_file, 'r') as f:
-                registrations = json.load(f)
+            registrations = read_registrations(reg_file)
     
     # Load form template
     template = None
     if event.get('template_id'):
-        templates_file = os.path.join(PROJECT_ROOT, 'data', 'form_templates.json')
         try:
-            with open(templates_file, 'r') as f:
-                templates = json.load(f)
-            template = next((t for t in templates if t.get('id') == event.get('template_id')), None)
-        except:
+            template = get_form_templates()[1].get(event.get('template_id'))
+        except Exception:
             pass
     
     return jsonify({
@@ -2064,36 +2864,31 @@ def api_admin_event_registrations(event_id):
 @api_admin_required
 def api_admin_toggle_registration(event_id):
     """Toggle registration for an event"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    events, next_id = load_events_file()
-    event = next((e for e in events if e.get('id') == event_id), None)
+    events, next_id, event = load_event_for_update(event_id)
     if not event:
         return jsonify({'error': 'Event not found'}), 404
     event['allow_registration'] = not event.get('allow_registration', True)
     save_events_file(events, next_id)
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
     return jsonify({'success': True, 'allow_registration': event['allow_registration']})
 
 @app.route('/api/admin/members', methods=['GET'])
 @api_admin_required
 def api_admin_members():
     """Get all members"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
-    return jsonify({'members': MEMBERS, 'club_info': {
-        'member_roles': CLUB_INFO.get('member_roles', []),
-        'member_years': CLUB_INFO.get('member_years', []),
+    snap = load_data()
+    return jsonify({'members': snap.members, 'club_info': {
+        'member_roles': snap.club_info.get('member_roles', []),
+        'member_years': snap.club_info.get('member_years', []),
     }})
 
 @app.route('/api/admin/members', methods=['POST'])
 @api_admin_required
 def api_admin_create_member():
     """Add a new member"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
     data = request.get_json(silent=True) or {}
     
     with open(os.path.join(PROJECT_ROOT, 'data/members.json'), 'r') as f:
-        members = json.load(f)
+        members = json_loads(f.read())
     
     members.append({
         'name': data.get('name', ''),
@@ -2105,25 +2900,23 @@ def api_admin_create_member():
         'github': data.get('github', ''),
     })
     
-    role_hierarchy = CLUB_INFO.get('member_roles', [])
-    year_hierarchy = CLUB_INFO.get('member_years', [])
+    club_info = load_data().club_info
+    role_hierarchy = club_info.get('member_roles', [])
+    year_hierarchy = club_info.get('member_years', [])
     if role_hierarchy:
         members = sort_members_by_role(members, role_hierarchy, year_hierarchy)
     
-    with open(os.path.join(PROJECT_ROOT, 'data/members.json'), 'w') as f:
-        json.dump(members, f, indent=4)
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+    save_data_file('members.json', members)
     return jsonify({'success': True})
 
 @app.route('/api/admin/members/<int:idx>', methods=['PUT'])
 @api_admin_required
 def api_admin_update_member(idx):
     """Update a member"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
     data = request.get_json(silent=True) or {}
     
     with open(os.path.join(PROJECT_ROOT, 'data/members.json'), 'r') as f:
-        members = json.load(f)
+        members = json_loads(f.read())
     if idx >= len(members):
         return jsonify({'error': 'Member not found'}), 404
     
@@ -2131,50 +2924,44 @@ def api_admin_update_member(idx):
         if key in data:
             members[idx][key] = data[key]
     
-    role_hierarchy = CLUB_INFO.get('member_roles', [])
-    year_hierarchy = CLUB_INFO.get('member_years', [])
+    club_info = load_data().club_info
+    role_hierarchy = club_info.get('member_roles', [])
+    year_hierarchy = club_info.get('member_years', [])
     if role_hierarchy:
         members = sort_members_by_role(members, role_hierarchy, year_hierarchy)
     
-    with open(os.path.join(PROJECT_ROOT, 'data/members.json'), 'w') as f:
-        json.dump(members, f, indent=4)
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+    save_data_file('members.json', members)
     return jsonify({'success': True})
 
 @app.route('/api/admin/members/<int:idx>', methods=['DELETE'])
 @api_admin_required
 def api_admin_delete_member(idx):
     """Delete a member"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
     
     with open(os.path.join(PROJECT_ROOT, 'data/members.json'), 'r') as f:
-        members = json.load(f)
+        members = json_loads(f.read())
     if idx < len(members):
         member = members[idx]
         delete_old_image(member.get('image', ''))
         members.pop(idx)
-        with open(os.path.join(PROJECT_ROOT, 'data/members.json'), 'w') as f:
-            json.dump(members, f, indent=4)
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+        save_data_file('members.json', members)
     return jsonify({'success': True})
 
 @app.route('/api/admin/gallery', methods=['GET'])
 @api_admin_required
 def api_admin_gallery():
     """Get all gallery images"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
-    return jsonify(GALLERY)
+    snap = load_data()
+    return jsonify(snap.gallery)
 
 @app.route('/api/admin/gallery', methods=['POST'])
 @api_admin_required
 def api_admin_create_gallery():
     """Add a gallery image"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
     data = request.get_json(silent=True) or {}
     
     with open(os.path.join(PROJECT_ROOT, 'data/gallery.json'), 'r') as f:
-        gallery = json.load(f)
+        gallery = json_loads(f.read())
     
     gallery.append({
         'url': data.get('url', ''),
@@ -2184,20 +2971,17 @@ def api_admin_create_gallery():
         'description': data.get('description', ''),
     })
     
-    with open(os.path.join(PROJECT_ROOT, 'data/gallery.json'), 'w') as f:
-        json.dump(gallery, f, indent=4)
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+    save_data_file('gallery.json', gallery)
     return jsonify({'success': True})
 
 @app.route('/api/admin/gallery/<int:idx>', methods=['PUT'])
 @api_admin_required
 def api_admin_update_gallery(idx):
     """Update a gallery image"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
     data = request.get_json(silent=True) or {}
     
     with open(os.path.join(PROJECT_ROOT, 'data/gallery.json'), 'r') as f:
-        gallery = json.load(f)
+        gallery = json_loads(f.read())
     if idx >= len(gallery):
         return jsonify({'error': 'Image not found'}), 404
     
@@ -2205,64 +2989,52 @@ def api_admin_update_gallery(idx):
         if key in data:
             gallery[idx][key] = data[key]
     
-    with open(os.path.join(PROJECT_ROOT, 'data/gallery.json'), 'w') as f:
-        json.dump(gallery, f, indent=4)
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+    save_data_file('gallery.json', gallery)
     return jsonify({'success': True})
 
 @app.route('/api/admin/gallery/<int:idx>', methods=['DELETE'])
 @api_admin_required
 def api_admin_delete_gallery(idx):
     """Delete a gallery image"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
     
     with open(os.path.join(PROJECT_ROOT, 'data/gallery.json'), 'r') as f:
-        gallery = json.load(f)
+        gallery = json_loads(f.read())
     if idx < len(gallery):
         image = gallery[idx]
         delete_old_image(image.get('url') or image.get('image', ''))
         gallery.pop(idx)
-        with open(os.path.join(PROJECT_ROOT, 'data/gallery.json'), 'w') as f:
-            json.dump(gallery, f, indent=4)
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+        save_data_file('gallery.json', gallery)
     return jsonify({'success': True})
 
 @app.route('/api/admin/contact', methods=['GET', 'PUT'])
 @api_admin_required
 def api_admin_contact():
     """Get or update contact information"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+    snap = load_data()
     
     if request.method == 'GET':
         return jsonify({
-            'email': CLUB_INFO.get('email', ''),
-            'linkedin': CLUB_INFO.get('linkedin', ''),
-            'instagram': CLUB_INFO.get('instagram', ''),
-            'faculty_coordinators': CLUB_INFO.get('faculty_coordinators', []),
-            'secretaries': CLUB_INFO.get('secretaries', []),
+            'email': snap.club_info.get('email', ''),
+            'linkedin': snap.club_info.get('linkedin', ''),
+            'instagram': snap.club_info.get('instagram', ''),
+            'faculty_coordinators': snap.club_info.get('faculty_coordinators', []),
+            'secretaries': snap.club_info.get('secretaries', []),
         })
     
     data = request.get_json(silent=True) or {}
+    club_info = dict(snap.club_info)
     for key in ['email', 'linkedin', 'instagram', 'faculty_coordinators', 'secretaries']:
         if key in data:
-            CLUB_INFO[key] = data[key]
+            club_info[key] = data[key]
     
-    with open(os.path.join(PROJECT_ROOT, 'data/club_info.json'), 'w') as f:
-        json.dump(CLUB_INFO, f, indent=4)
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+    save_data_file('club_info.json', club_info)
     return jsonify({'success': True})
 
 @app.route('/api/admin/form-templates', methods=['GET'])
 @api_admin_required
 def api_admin_form_templates():
     """Get all form templates"""
-    templates_file = os.path.join(PROJECT_ROOT, 'data', 'form_templates.json')
-    templates = []
-    if os.path.exists(templates_file):
-        with open(templates_file, 'r') as f:
-            templates = json.load(f)
-    return jsonify(templates)
+    return jsonify(get_form_templates()[0])
 
 @app.route('/api/admin/form-templates', methods=['POST'])
 @api_admin_required
@@ -2273,14 +3045,13 @@ def api_admin_create_form_template():
     templates = []
     if os.path.exists(templates_file):
         with open(templates_file, 'r') as f:
-            templates = json.load(f)
+            templates = json_loads(f.read())
     
     max_id = max([t.get('id', 0) for t in templates], default=0)
     data['id'] = max_id + 1
     templates.append(data)
     
-    with open(templates_file, 'w') as f:
-        json.dump(templates, f, indent=4)
+    write_json_file(templates_file, templates)
     return jsonify({'success': True, 'id': data['id']})
 
 @app.route('/api/admin/form-templates/<int:form_id>', methods=['PUT'])
@@ -2291,7 +3062,7 @@ def api_admin_update_form_template(form_id):
     templates_file = os.path.join(PROJECT_ROOT, 'data', 'form_templates.json')
     
     with open(templates_file, 'r') as f:
-        templates = json.load(f)
+        templates = json_loads(f.read())
     
     template = next((t for t in templates if t.get('id') == form_id), None)
     if not template:
@@ -2301,8 +3072,7 @@ def api_admin_update_form_template(form_id):
         if key != 'id':
             template[key] = data[key]
     
-    with open(templates_file, 'w') as f:
-        json.dump(templates, f, indent=4)
+    write_json_file(templates_file, templates)
     return jsonify({'success': True})
 
 @app.route('/api/admin/form-templates/<int:form_id>', methods=['DELETE'])
@@ -2312,12 +3082,11 @@ def api_admin_delete_form_template(form_id):
     templates_file = os.path.join(PROJECT_ROOT, 'data', 'form_templates.json')
     
     with open(templates_file, 'r') as f:
-        templates = json.load(f)
+        templates = json_loads(f.read())
     
     templates = [t for t in templates if t.get('id') != form_id]
     
-    with open(templates_file, 'w') as f:
-        json.dump(templates, f, indent=4)
+    write_json_file(templates_file, templates)
     return jsonify({'success': True})
 
 @app.route('/api/admin/form-templates/<int:form_id>/toggle', methods=['POST'])
@@ -2327,7 +3096,7 @@ def api_admin_toggle_form_template(form_id):
     templates_file = os.path.join(PROJECT_ROOT, 'data', 'form_templates.json')
     
     with open(templates_file, 'r') as f:
-        templates = json.load(f)
+        templates = json_loads(f.read())
     
     template = next((t for t in templates if t.get('id') == form_id), None)
     if not template:
@@ -2335,8 +3104,7 @@ def api_admin_toggle_form_template(form_id):
     
     template['active'] = not template.get('active', True)
     
-    with open(templates_file, 'w') as f:
-        json.dump(templates, f, indent=4)
+    write_json_file(templates_file, templates)
     return jsonify({'success': True, 'active': template['active']})
 
 @app.route('/api/admin/mark-entry', methods=['POST'])
@@ -2359,10 +3127,9 @@ def api_admin_mark_entry():
     except (ValueError, TypeError):
         return jsonify({'error': 'Invalid event ID'}), 400
     
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+    snap = load_data()
     
-    event = next((e for e in EVENTS if e.get('id') == event_id), None)
+    event = get_event_by_id(snap.events, event_id)
     if not event:
         return jsonify({'error': 'Event not found'}), 404
     
@@ -2373,39 +3140,32 @@ def api_admin_mark_entry():
         event_slug = slugify(event.get('name', ''))
         reg_file_path = os.path.join(PROJECT_ROOT, 'data', 'registrations', f'{event_slug}_registrations.json')
     
-    registrations = safe_json_read(reg_file_path)
-    
-    updated = False
-    for reg in registrations:
-        if reg.get('registration_id') == regid and reg.get('submitter_email', '').lower() == email.lower():
-            if attendance_type == 'participants' and participant_attendance:
-                reg['participant_attendance'] = participant_attendance
-                total = len(participant_attendance)
-                present = sum(1 for p in participant_attendance if p)
-                if present == total:
-                    reg['attendance_status'] = 'entered'
-                elif present > 0:
-                    reg['attendance_status'] = 'partially_present'
-                else:
-                    reg['attendance_status'] = 'not_entered'
-                reg['attendance_comment'] = f'{present}/{total} participants present'
+    def mark(reg):
+        if attendance_type == 'participants' and participant_attendance:
+            reg['participant_attendance'] = participant_attendance
+            total = len(participant_attendance)
+            present = sum(1 for p in participant_attendance if p)
+            if present == total:
+                reg['attendance_status'] = 'entered'
+            elif present > 0:
+                reg['attendance_status'] = 'partially_present'
             else:
-                reg['attendance_status'] = 'partially_present' if attendance_type == 'partial' else 'entered'
-                reg['attendance_comment'] = attendance_comment
-            
-            reg['entry_time'] = datetime.now().isoformat()
-            reg['marked_by'] = 'admin'
-            updated = True
-            break
-    
-    if not updated:
-        return jsonify({'error': 'Registration not found'}), 404
+                reg['attendance_status'] = 'not_entered'
+            reg['attendance_comment'] = f'{present}/{total} participants present'
+        else:
+            reg['attendance_status'] = 'partially_present' if attendance_type == 'partial' else 'entered'
+            reg['attendance_comment'] = attendance_comment
+        
+        reg['entry_time'] = datetime.now().isoformat()
+        reg['marked_by'] = 'admin'
     
     try:
-        safe_json_write(reg_file_path, registrations)
-        return jsonify({'success': True})
+        updated = update_registration_entry(reg_file_path, regid, email.lower(), mark)
     except Exception:
         return jsonify({'error': 'Failed to save'}), 500
+    if not updated:
+        return jsonify({'error': 'Registration not found'}), 404
+    return jsonify({'success': True})
 
 @app.route('/api/admin/upload', methods=['POST'])
 @api_admin_required
@@ -2417,13 +3177,7 @@ def api_admin_upload():
     if file.filename == '':
         return jsonify({'error': 'No file selected'}), 400
     if file and allowed_file(file.filename):
-        filename = secure_filename(file.filename)
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{timestamp}_{filename}"
-        os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
-        return jsonify({'url': f"/static/uploads/{filename}"})
+        return jsonify({'url': save_upload(file)})
     return jsonify({'error': 'Invalid file type'}), 400
 
 # ========================================
@@ -2471,39 +3225,31 @@ def admin_required(f):
 @admin_required
 def admin_dashboard():
     """Admin dashboard"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+    snap = load_data()
     return render_template('admin/dashboard.html',
-                         events_count=len(EVENTS),
-                         members_count=len(MEMBERS),
-                         gallery_count=len(GALLERY),
-                         gallery=GALLERY)
+                         events_count=len(snap.events),
+                         members_count=len(snap.members),
+                         gallery_count=len(snap.gallery),
+                         gallery=snap.gallery)
 
 @app.route('/admin/club-info', methods=['GET', 'POST'])
 @admin_required
 def admin_club_info():
     """Edit club information"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
     
     if request.method == 'POST':
         # Reload current club info
-        CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+        snap = load_data()
         
         # Handle logo upload
-        logo_url = CLUB_INFO.get('logo', '/static/img/aicc-logo.webp')
+        logo_url = snap.club_info.get('logo', '/static/img/aicc-logo.webp')
         if 'logo_image' in request.files:
             file = request.files['logo_image']
             if file and file.filename and allowed_file(file.filename):
                 # Delete old logo if it's in uploads folder
                 delete_old_image(logo_url)
                 
-                filename = secure_filename(file.filename)
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                filename = f"{timestamp}_{filename}"
-                os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
-                filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-                file.save(filepath)
-                logo_url = f"/static/uploads/{filename}"
+                logo_url = save_upload(file)
         
         # Process member_roles and member_years arrays from form
         member_roles = []
@@ -2515,7 +3261,7 @@ def admin_club_info():
             try:
                 member_roles = json.loads(role_data)
             except:
-                member_roles = CLUB_INFO.get('member_roles', [])
+                member_roles = snap.club_info.get('member_roles', [])
         
         # Get years from form
         year_data = request.form.get('member_years_json')
@@ -2523,7 +3269,7 @@ def admin_club_info():
             try:
                 member_years = json.loads(year_data)
             except:
-                member_years = CLUB_INFO.get('member_years', [])
+                member_years = snap.club_info.get('member_years', [])
         
         data = {
             'name': request.form.get('name'),
@@ -2536,9 +3282,9 @@ def admin_club_info():
             'logo': logo_url,
             'member_roles': member_roles,
             'member_years': member_years,
-            'email': CLUB_INFO.get('email', ''),
-            'linkedin': CLUB_INFO.get('linkedin', ''),
-            'instagram': CLUB_INFO.get('instagram', ''),
+            'email': snap.club_info.get('email', ''),
+            'linkedin': snap.club_info.get('linkedin', ''),
+            'instagram': snap.club_info.get('instagram', ''),
             'email_config': {
                 'MAIL_SERVER': request.form.get('mail_server', 'smtp.gmail.com'),
                 'MAIL_PORT': int(request.form.get('mail_port', 587) or 587),
@@ -2553,15 +3299,11 @@ def admin_club_info():
                 'RAZORPAY_KEY_ID': request.form.get('razorpay_key_id', ''),
                 'RAZORPAY_KEY_SECRET': request.form.get('razorpay_key_secret', '')
             },
-            'faculty_coordinators': CLUB_INFO.get('faculty_coordinators', []),
-            'secretaries': CLUB_INFO.get('secretaries', [])
+            'faculty_coordinators': snap.club_info.get('faculty_coordinators', []),
+            'secretaries': snap.club_info.get('secretaries', [])
         }
         
-        with open(os.path.join(PROJECT_ROOT, 'data/club_info.json'), 'w') as f:
-            json.dump(data, f, indent=4)
-        
-        # Reload data
-        CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+        save_data_file('club_info.json', data)
         
         # Reconfigure Flask-Mail with new SMTP settings
         configure_mail()
@@ -2569,48 +3311,31 @@ def admin_club_info():
         flash('Club information updated successfully!', 'success')
         return redirect(url_for('admin_club_info'))
     
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
-    return render_template('admin/club_info.html', club_info=CLUB_INFO)
+    snap = load_data()
+    return render_template('admin/club_info.html', club_info=snap.club_info)
 
 @app.route('/admin/events', methods=['GET'])
 @admin_required
 def admin_events():
     """View all events"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
-    return render_template('admin/events.html', events=EVENTS)
+    snap = load_data()
+    return render_template('admin/events.html', events=snap.events)
 
 @app.route('/admin/events/create', methods=['GET', 'POST'])
 @admin_required
 def admin_create_event():
     """Create a new event"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
     
     if request.method == 'POST':
         # Reload events from file
-        with open(os.path.join(PROJECT_ROOT, 'data/events.json'), 'r') as f:
-            events_data = json.load(f)
-        
-        # Handle both old array format and new object format
-        if isinstance(events_data, list):
-            events = events_data
-            next_id = max([e.get('id', 0) for e in events], default=0) + 1
-        else:
-            events = events_data.get('events', [])
-            next_id = events_data.get('next_id', 1)
+        events, next_id = load_events_file()
         
         # Handle image upload
         image_url = ''
         if 'event_image' in request.files:
             file = request.files['event_image']
             if file and file.filename and allowed_file(file.filename):
-                filename = secure_filename(file.filename)
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                filename = f"{timestamp}_{filename}"
-                os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
-                filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-                file.save(filepath)
-                image_url = f"/static/uploads/{filename}"
+                image_url = save_upload(file)
         
         # Add new event using next_id
         new_event = {
@@ -2642,19 +3367,7 @@ def admin_create_event():
             
             # Create registration file for internal registration
             if new_event['template_id']:
-                event_slug = re.sub(r'[^a-z0-9]+', '_', new_event['name'].lower()).strip('_')
-                # Include event ID for uniqueness (same name events get different files)
-                reg_filename = f"{event_slug}_{new_event['id']}_registrations.json"
-                reg_file_path = os.path.join(PROJECT_ROOT, 'data', 'registrations', reg_filename)
-                
-                # Create registrations directory if it doesn't exist
-                os.makedirs(os.path.dirname(reg_file_path), exist_ok=True)
-                
-                # Create empty registration file
-                with open(reg_file_path, 'w') as f:
-                    json.dump([], f)
-                
-                new_event['registration_file'] = f'data/registrations/{reg_filename}'
+                create_registration_file(new_event)
         else:
             new_event['register_link'] = '#'
             new_event['template_id'] = None
@@ -2671,22 +3384,15 @@ def admin_create_event():
         events.append(new_event)
         
         # Save with incremented next_id
-        with open(os.path.join(PROJECT_ROOT, 'data/events.json'), 'w') as f:
-            json.dump({"next_id": next_id + 1, "events": events}, f, indent=4)
-        
-        # Reload data
-        CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+        save_data_file('events.json', {"next_id": next_id + 1, "events": events})
         
         flash('Event created successfully!', 'success')
         return redirect(url_for('admin_events'))
     
     # Load form templates for the dropdown
     templates = []
-    templates_file = os.path.join(PROJECT_ROOT, 'data', 'form_templates.json')
     try:
-        if os.path.exists(templates_file):
-            with open(templates_file, 'r') as f:
-                templates = json.load(f)
+        templates = get_form_templates()[0]
     except Exception as e:
         logger.error(f"Error loading templates: {e}")
     
@@ -2696,13 +3402,11 @@ def admin_create_event():
 @admin_required
 def admin_delete_event(event_id):
     """Archive an event by marking it as completed (preserves registration data for attendance checks)"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
     
-    events, next_id = load_events_file()
+    events, next_id, event_to_archive = load_event_for_update(event_id)
     
     # Find the event and mark as completed instead of deleting
     # This preserves registration data so students can still check their attendance
-    event_to_archive = next((e for e in events if e.get('id') == event_id), None)
     if event_to_archive:
         event_to_archive['status'] = 'completed'
         event_to_archive['registration_type'] = 'none'  # Disable registration
@@ -2710,9 +3414,6 @@ def admin_delete_event(event_id):
     
     save_events_file(events, next_id)
     
-    # Reload data
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
-    
     flash('Event archived successfully! Registration data preserved for attendance checks.', 'success')
     return redirect(url_for('admin_events'))
 
@@ -2720,24 +3421,17 @@ def admin_delete_event(event_id):
 @admin_required
 def admin_members():
     """Manage members"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
     
     if request.method == 'POST':
         with open(os.path.join(PROJECT_ROOT, 'data/members.json'), 'r') as f:
-            members = json.load(f)
+            members = json_loads(f.read())
         
         # Handle image upload
         image_url = '/static/img/members/default.webp'
         if 'member_image' in request.files:
             file = request.files['member_image']
             if file and file.filename and allowed_file(file.filename):
-                filename = secure_filename(file.filename)
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                filename = f"{timestamp}_{filename}"
-                os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
-                filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-                file.save(filepath)
-                image_url = f"/static/uploads/{filename}"
+                image_url = save_upload(file)
         
         new_member = {
             'name': request.form.get('name'),
@@ -2752,49 +3446,41 @@ def admin_members():
         members.append(new_member)
         
         # Sort members by role hierarchy and year before saving
-        role_hierarchy = CLUB_INFO.get('member_roles', [])
-        year_hierarchy = CLUB_INFO.get('member_years', [])
+        club_info = load_data().club_info
+        role_hierarchy = club_info.get('member_roles', [])
+        year_hierarchy = club_info.get('member_years', [])
         if role_hierarchy:
             members = sort_members_by_role(members, role_hierarchy, year_hierarchy)
         
-        with open(os.path.join(PROJECT_ROOT, 'data/members.json'), 'w') as f:
-            json.dump(members, f, indent=4)
-        
-        # Reload data
-        CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+        save_data_file('members.json', members)
         
         flash('Member added successfully!', 'success')
         return redirect(url_for('admin_members'))
     
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
-    return render_template('admin/members.html', members=MEMBERS, club_info=CLUB_INFO)
+    snap = load_data()
+    return render_template('admin/members.html', members=snap.members, club_info=snap.club_info)
 
 @app.route('/admin/contact', methods=['GET', 'POST'])
 @admin_required
 def admin_contact():
     """Edit contact information"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
     
     if request.method == 'POST':
         # Load current club info and update contact fields
-        CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+        club_info = dict(load_data().club_info)
         
-        CLUB_INFO['email'] = request.form.get('email')
-        CLUB_INFO['instagram'] = request.form.get('instagram')
-        CLUB_INFO['linkedin'] = request.form.get('linkedin')
+        club_info['email'] = request.form.get('email')
+        club_info['instagram'] = request.form.get('instagram')
+        club_info['linkedin'] = request.form.get('linkedin')
         # Keep existing faculty_coordinators and secretaries
         
-        with open(os.path.join(PROJECT_ROOT, 'data/club_info.json'), 'w') as f:
-            json.dump(CLUB_INFO, f, indent=4)
-        
-        # Reload data
-        CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+        save_data_file('club_info.json', club_info)
         
         flash('Contact information updated successfully!', 'success')
         return redirect(url_for('admin_contact'))
     
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
-    return render_template('admin/contact.html', contact=CLUB_INFO)
+    snap = load_data()
+    return render_template('admin/contact.html', contact=snap.club_info)
 
 # ========================================
 # File Upload Routes
@@ -2812,19 +3498,7 @@ def upload_file():
         return jsonify({'error': 'No file selected'}), 400
     
     if file and allowed_file(file.filename):
-        filename = secure_filename(file.filename)
-        # Add timestamp to avoid conflicts
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = f"{timestamp}_{filename}"
-        
-        # Ensure upload folder exists
-        os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
-        
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
-        
-        # Return URL path
-        url = f"/static/uploads/{filename}"
+        url = save_upload(file)
         return jsonify({'url': url}), 200
     
     return jsonify({'error': 'Invalid file type'}), 400
@@ -2837,11 +3511,9 @@ def upload_file():
 @admin_required
 def admin_edit_event(event_id):
     """Edit an existing event"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
     
-    events, next_id = load_events_file()
+    events, next_id, event = load_event_for_update(event_id)
     
-    event = next((e for e in events if e.get('id') == event_id), None)
     if not event:
         flash('Event not found!', 'error')
         return redirect(url_for('admin_events'))
@@ -2855,13 +3527,7 @@ def admin_edit_event(event_id):
                 # Delete old image before uploading new one
                 delete_old_image(image_url)
                 
-                filename = secure_filename(file.filename)
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                filename = f"{timestamp}_{filename}"
-                os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
-                filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-                file.save(filepath)
-                image_url = f"/static/uploads/{filename}"
+                image_url = save_upload(file)
         
         # Update event data
         event['name'] = request.form.get('name')
@@ -2895,21 +3561,7 @@ def admin_edit_event(event_id):
             
             # Create/update registration file if template is set and no file exists
             if new_template_id and not event.get('registration_file'):
-                # Generate registration filename based on event name and ID for uniqueness
-                event_slug = re.sub(r'[^a-z0-9]+', '_', event['name'].lower()).strip('_')
-                reg_filename = f"{event_slug}_{event['id']}_registrations.json"
-                reg_file_path = os.path.join(PROJECT_ROOT, 'data', 'registrations', reg_filename)
-                
-                # Create registrations directory if it doesn't exist
-                os.makedirs(os.path.dirname(reg_file_path), exist_ok=True)
-                
-                # Create empty registration file if it doesn't exist
-                if not os.path.exists(reg_file_path):
-                    with open(reg_file_path, 'w') as f:
-                        json.dump([], f)
-                
-                # Update the registration_file path in event
-                event['registration_file'] = f'data/registrations/{reg_filename}'
+                create_registration_file(event)
         else:
             event['register_link'] = '#'
             event['template_id'] = None
@@ -2931,19 +3583,13 @@ def admin_edit_event(event_id):
         
         save_events_file(events, next_id)
         
-        # Reload data
-        CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
-        
         flash('Event updated successfully!', 'success')
         return redirect(url_for('admin_events'))
     
     # Load form templates for the dropdown
     templates = []
-    templates_file = os.path.join(PROJECT_ROOT, 'data', 'form_templates.json')
     try:
-        if os.path.exists(templates_file):
-            with open(templates_file, 'r') as f:
-                templates = json.load(f)
+        templates = get_form_templates()[0]
     except Exception as e:
         logger.error(f"Error loading templates: {e}")
     
@@ -2953,12 +3599,10 @@ def admin_edit_event(event_id):
 @admin_required
 def admin_delete_event_image(event_id):
     """Delete event image"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
     
     try:
-        events, next_id = load_events_file()
+        events, next_id, event = load_event_for_update(event_id)
         
-        event = next((e for e in events if e.get('id') == event_id), None)
         if not event:
             return jsonify({'success': False, 'error': 'Event not found'}), 404
         
@@ -2970,9 +3614,6 @@ def admin_delete_event_image(event_id):
             # Save updated events
             save_events_file(events, next_id)
             
-            # Reload data
-            CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
-            
             return jsonify({'success': True})
         else:
             return jsonify({'success': False, 'error': 'No image to delete'}), 400
@@ -2984,10 +3625,9 @@ def admin_delete_event_image(event_id):
 @admin_required
 def admin_edit_member(member_index):
     """Edit an existing member"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
     
     with open(os.path.join(PROJECT_ROOT, 'data/members.json'), 'r') as f:
-        members = json.load(f)
+        members = json_loads(f.read())
     
     if member_index >= len(members):
         flash('Member not found!', 'error')
@@ -3011,13 +3651,7 @@ def admin_edit_member(member_index):
                 # Delete old image before uploading new one
                 delete_old_image(image_url)
                 
-                filename = secure_filename(file.filename)
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                filename = f"{timestamp}_{filename}"
-                os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
-                filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-                file.save(filepath)
-                image_url = f"/static/uploads/{filename}"
+                image_url = save_upload(file)
         
         # Update member data
         members[member_index] = {
@@ -3031,32 +3665,28 @@ def admin_edit_member(member_index):
         }
         
         # Sort members by role hierarchy and year before saving
-        role_hierarchy = CLUB_INFO.get('member_roles', [])
-        year_hierarchy = CLUB_INFO.get('member_years', [])
+        club_info = load_data().club_info
+        role_hierarchy = club_info.get('member_roles', [])
+        year_hierarchy = club_info.get('member_years', [])
         if role_hierarchy:
             members = sort_members_by_role(members, role_hierarchy, year_hierarchy)
         
-        with open(os.path.join(PROJECT_ROOT, 'data/members.json'), 'w') as f:
-            json.dump(members, f, indent=4)
-        
-        # Reload data
-        CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+        save_data_file('members.json', members)
         
         flash('Member updated successfully!', 'success')
         return redirect(url_for('admin_members'))
     
     # Load club_info for role and year dropdowns
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
-    return render_template('admin/edit_member.html', member=member, member_index=member_index, club_info=CLUB_INFO)
+    snap = load_data()
+    return render_template('admin/edit_member.html', member=member, member_index=member_index, club_info=snap.club_info)
 
 @app.route('/admin/members/<int:member_index>/delete', methods=['POST'])
 @admin_required
 def admin_delete_member(member_index):
     """Delete a member"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
     
     with open(os.path.join(PROJECT_ROOT, 'data/members.json'), 'r') as f:
-        members = json.load(f)
+        members = json_loads(f.read())
     
     if member_index < len(members):
         # Delete member's image before removing from list
@@ -3065,11 +3695,7 @@ def admin_delete_member(member_index):
         
         members.pop(member_index)
         
-        with open(os.path.join(PROJECT_ROOT, 'data/members.json'), 'w') as f:
-            json.dump(members, f, indent=4)
-        
-        # Reload data
-        CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+        save_data_file('members.json', members)
         
         flash('Member deleted successfully!', 'success')
     
@@ -3079,51 +3705,40 @@ def admin_delete_member(member_index):
 @admin_required
 def admin_gallery():
     """Manage gallery images"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
     
     if request.method == 'POST':
         if 'gallery_image' in request.files:
             file = request.files['gallery_image']
             if file and file.filename and allowed_file(file.filename):
-                filename = secure_filename(file.filename)
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                filename = f"{timestamp}_{filename}"
-                os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
-                filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-                file.save(filepath)
+                image_url = save_upload(file)
                 
                 # Add to gallery
                 with open(os.path.join(PROJECT_ROOT, 'data/gallery.json'), 'r') as f:
-                    gallery = json.load(f)
+                    gallery = json_loads(f.read())
                 
                 new_image = {
-                    'url': f"/static/uploads/{filename}",
+                    'url': image_url,
                     'title': request.form.get('title', 'Gallery Image'),
                     'category': request.form.get('category', 'events')
                 }
                 
                 gallery.append(new_image)
                 
-                with open(os.path.join(PROJECT_ROOT, 'data/gallery.json'), 'w') as f:
-                    json.dump(gallery, f, indent=4)
-                
-                # Reload data
-                CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+                save_data_file('gallery.json', gallery)
                 
                 flash('Image uploaded successfully!', 'success')
                 return redirect(url_for('admin_gallery'))
     
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
-    return render_template('admin/gallery.html', gallery=GALLERY)
+    snap = load_data()
+    return render_template('admin/gallery.html', gallery=snap.gallery)
 
 @app.route('/admin/gallery/<int:image_index>/edit', methods=['GET', 'POST'])
 @admin_required
 def admin_edit_gallery_image(image_index):
     """Edit a gallery image"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
     
     with open(os.path.join(PROJECT_ROOT, 'data/gallery.json'), 'r') as f:
-        gallery = json.load(f)
+        gallery = json_loads(f.read())
     
     if image_index >= len(gallery):
         flash('Image not found!', 'error')
@@ -3137,11 +3752,7 @@ def admin_edit_gallery_image(image_index):
         image['category'] = request.form.get('category', 'events')
         image['description'] = request.form.get('description', '')
         
-        with open(os.path.join(PROJECT_ROOT, 'data/gallery.json'), 'w') as f:
-            json.dump(gallery, f, indent=4)
-        
-        # Reload data
-        CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+        save_data_file('gallery.json', gallery)
         
         flash('Image updated successfully!', 'success')
         return redirect(url_for('admin_gallery'))
@@ -3152,10 +3763,9 @@ def admin_edit_gallery_image(image_index):
 @admin_required
 def admin_delete_gallery_image(image_index):
     """Delete a gallery image"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
     
     with open(os.path.join(PROJECT_ROOT, 'data/gallery.json'), 'r') as f:
-        gallery = json.load(f)
+        gallery = json_loads(f.read())
     
     if image_index < len(gallery):
         # Delete the image file before removing from gallery
@@ -3164,11 +3774,7 @@ def admin_delete_gallery_image(image_index):
         
         gallery.pop(image_index)
         
-        with open(os.path.join(PROJECT_ROOT, 'data/gallery.json'), 'w') as f:
-            json.dump(gallery, f, indent=4)
-        
-        # Reload data
-        CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+        save_data_file('gallery.json', gallery)
         
         flash('Image deleted successfully!', 'success')
     
@@ -3182,13 +3788,10 @@ def admin_delete_gallery_image(image_index):
 @admin_required
 def admin_registration_forms():
     """Admin page to manage form templates"""
-    templates_file = os.path.join(PROJECT_ROOT, 'data', 'form_templates.json')
     templates = []
     
     try:
-        if os.path.exists(templates_file):
-            with open(templates_file, 'r') as f:
-                templates = json.load(f)
+        templates = get_form_templates()[0]
     except Exception as e:
         flash('Error loading form templates.', 'error')
     
@@ -3206,7 +3809,7 @@ def admin_create_registration_form():
             templates = []
             if os.path.exists(templates_file):
                 with open(templates_file, 'r') as f:
-                    templates = json.load(f)
+                    templates = json_loads(f.read())
             
             # Generate unique ID
             max_id = max([t.get('id', 0) for t in templates], default=0)
@@ -3229,8 +3832,7 @@ def admin_create_registration_form():
             templates.append(template_data)
             
             # Save to file
-            with open(templates_file, 'w') as f:
-                json.dump(templates, f, indent=4)
+            write_json_file(templates_file, templates)
             
             flash('Form template created successfully!', 'success')
             return redirect(url_for('admin_registration_forms'))
@@ -3248,7 +3850,7 @@ def admin_edit_registration_form(form_id):
     
     try:
         with open(templates_file, 'r') as f:
-            templates = json.load(f)
+            templates = json_loads(f.read())
     except:
         flash('Error loading form templates.', 'error')
         return redirect(url_for('admin_registration_forms'))
@@ -3273,8 +3875,7 @@ def admin_edit_registration_form(form_id):
             templates[template_index]['payment_description'] = request.form.get('payment_description', '') if request.form.get('payment_enabled') == 'true' else ''
             
             # Save to file
-            with open(templates_file, 'w') as f:
-                json.dump(templates, f, indent=4)
+            write_json_file(templates_file, templates)
             
             flash('Form template updated successfully!', 'success')
             return redirect(url_for('admin_registration_forms'))
@@ -3294,15 +3895,14 @@ def admin_toggle_form_status(form_id):
     
     try:
         with open(templates_file, 'r') as f:
-            templates = json.load(f)
+            templates = json_loads(f.read())
         
         # Find the template and toggle its active status
         template = next((t for t in templates if t.get('id') == form_id), None)
         if template:
             template['active'] = not template.get('active', True)
             
-            with open(templates_file, 'w') as f:
-                json.dump(templates, f, indent=4)
+            write_json_file(templates_file, templates)
             
             status = 'activated' if template['active'] else 'deactivated'
             flash(f'Form template {status} successfully!', 'success')
@@ -3322,15 +3922,14 @@ def admin_delete_registration_form(form_id):
     
     try:
         with open(templates_file, 'r') as f:
-            templates = json.load(f)
+            templates = json_loads(f.read())
         
         # Find and remove the template
         template_index = next((i for i, t in enumerate(templates) if t.get('id') == form_id), None)
         if template_index is not None:
             templates.pop(template_index)
             
-            with open(templates_file, 'w') as f:
-                json.dump(templates, f, indent=4)
+            write_json_file(templates_file, templates)
             
             flash('Form template deleted successfully!', 'success')
         else:
@@ -3345,14 +3944,13 @@ def admin_delete_registration_form(form_id):
 @admin_required
 def admin_send_attendance_emails(event_id):
     """Send attendance verification emails to registrants"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+    snap = load_data()
     
     try:
         data = request.get_json()
         filter_type = data.get('filter', 'marked')
         
-        event = next((e for e in EVENTS if e.get('id') == event_id), None)
+        event = get_event_by_id(snap.events, event_id)
         if not event:
             return jsonify({'success': False, 'message': 'Event not found.'})
         
@@ -3361,14 +3959,12 @@ def admin_send_attendance_emails(event_id):
         if event.get('registration_file'):
             reg_file = os.path.join(PROJECT_ROOT, event['registration_file'])
             if os.path.exists(reg_file):
-                with open(reg_file, 'r') as f:
-                    registrations = json.load(f)
+                registrations = read_registrations(reg_file)
         else:
             event_slug = slugify(event.get('name', ''))
             reg_file = os.path.join(PROJECT_ROOT, 'data', 'registrations', f'{event_slug}_registrations.json')
             if os.path.exists(reg_file):
-                with open(reg_file, 'r') as f:
-                    registrations = json.load(f)
+                registrations = read_registrations(reg_file)
         
         if not registrations:
             return jsonify({'success': False, 'message': 'No registrations found for this event.'})
@@ -3393,159 +3989,181 @@ def admin_send_attendance_emails(event_id):
         sent_count = 0
         failed_count = 0
         
-        for reg in filtered_registrations:
+        # One SMTP connection (and login) for the whole batch instead of one per email;
+        # if it drops mid-batch, reconnect and carry on from the first unsent recipient
+        ensure_mail_configured()
+        pending = deque(filtered_registrations)
+        connection_error = None
+        while pending and connection_error is None:
+            sent_on_connection = 0
             try:
-                email = reg.get('submitter_email')
-                if not email:
-                    failed_count += 1
-                    continue
-                
-                # Generate shareable link
-                shareable_link = url_for('attendance_check',
-                                        event_id=event_id,
-                                        email=email,
-                                        rid=reg.get('registration_id'),
-                                        _external=True)
-                
-                # Generate QR code for the link
-                qr = qrcode.QRCode(version=1, box_size=10, border=4)
-                qr.add_data(shareable_link)
-                qr.make(fit=True)
-                qr_img = qr.make_image(fill_color="black", back_color="white")
-                
-                buffered = io.BytesIO()
-                qr_img.save(buffered, format="PNG")
-                qr_base64 = base64.b64encode(buffered.getvalue()).decode('utf-8')
-                
-                # Determine status text and styling
-                status = reg.get('attendance_status', 'not_entered')
-                if status == 'entered':
-                    status_text = 'Fully Present'
-                    status_color = '#10b981'
-                    status_icon = '✓'
-                elif status == 'partially_present':
-                    status_text = 'Partially Present'
-                    status_color = '#f59e0b'
-                    status_icon = '⚠'
-                else:
-                    status_text = 'Attendance Not Marked'
-                    status_color = '#6b7280'
-                    status_icon = '○'
-                
-                # Get participant info
-                participant_name = reg.get('name', reg.get('submitter_email', 'Participant'))
-                
-                # Build email HTML
-                email_html = f"""
-                <html>
-                <body style="font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; margin: 0; padding: 20px; background-color: #f8f9fa;">
-                    <div style="max-width: 600px; margin: 0 auto; background: white; border-radius: 16px; overflow: hidden; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
-                        <!-- Header -->
-                        <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 30px; text-align: center;">
-                            <h1 style="color: white; margin: 0; font-size: 24px;">📋 Attendance Certificate</h1>
-                            <p style="color: rgba(255,255,255,0.9); margin: 10px 0 0; font-size: 16px;">{html_escape(event.get('name', 'Event'))}</p>
-                        </div>
-                        
-                        <!-- Status Badge -->
-                        <div style="text-align: center; padding: 30px;">
-                            <div style="display: inline-block; padding: 15px 30px; background: {status_color}20; border-radius: 50px; border: 2px solid {status_color};">
-                                <span style="font-size: 24px; color: {status_color}; font-weight: bold;">{status_icon} {status_text}</span>
-                            </div>
-                        </div>
-                        
-                        <!-- Details -->
-                        <div style="padding: 0 30px 30px;">
-                            <h3 style="color: #1f2937; margin: 0 0 15px;">Hello {html_escape(participant_name)},</h3>
-                            <p style="color: #4b5563; line-height: 1.6;">
-                                Your attendance for <strong>{html_escape(event.get('name', 'the event'))}</strong> has been recorded.
-                                Below are your details for verification:
-                            </p>
+                with mail.connect() as conn:
+                    while pending:
+                        reg = pending[0]
+                        try:
+                            email = reg.get('submitter_email')
+                            if not email:
+                                pending.popleft()
+                                failed_count += 1
+                                continue
+                            
+                            # Generate shareable link
+                            shareable_link = url_for('attendance_check',
+                                                    event_id=event_id,
+                                                    email=email,
+                                                    rid=reg.get('registration_id'),
+                                                    _external=True)
+                            
+                            # Generate QR code for the link (raw PNG, attached below)
+                            qr_png = generate_qr_code(shareable_link)
+                            
+                            # Determine status text and styling
+                            status = reg.get('attendance_status', 'not_entered')
+                            if status == 'entered':
+                                status_text = 'Fully Present'
+                                status_color = '#10b981'
+                                status_icon = '✓'
+                            elif status == 'partially_present':
+                                status_text = 'Partially Present'
+                                status_color = '#f59e0b'
+                                status_icon = '⚠'
+                            else:
+                                status_text = 'Attendance Not Marked'
+                                status_color = '#6b7280'
+                                status_icon = '○'
+                            
+                            # Get participant info
+                            participant_name = reg.get('name', reg.get('submitter_email', 'Participant'))
+                            
+                            # Build email HTML
+                            email_html = f"""
+                            <html>
+                            <body style="font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; margin: 0; padding: 20px; background-color: #f8f9fa;">
+                                <div style="max-width: 600px; margin: 0 auto; background: white; border-radius: 16px; overflow: hidden; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
+                                    <!-- Header -->
+                                    <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 30px; text-align: center;">
+                                        <h1 style="color: white; margin: 0; font-size: 24px;">📋 Attendance Certificate</h1>
+                                        <p style="color: rgba(255,255,255,0.9); margin: 10px 0 0; font-size: 16px;">{html_escape(event.get('name', 'Event'))}</p>
+                                    </div>
                             
-                            <table style="width: 100%; border-collapse: collapse; margin: 20px 0;">
-                                <tr style="background: #f3f4f6;">
-                                    <td style="padding: 12px 15px; border-bottom: 1px solid #e5e7eb; font-weight: 600; color: #374151;">Event</td>
-                                    <td style="padding: 12px 15px; border-bottom: 1px solid #e5e7eb; color: #1f2937;">{html_escape(event.get('name', '-'))}</td>
-                                </tr>
-                                <tr>
-                                    <td style="padding: 12px 15px; border-bottom: 1px solid #e5e7eb; font-weight: 600; color: #374151;">Date</td>
-                                    <td style="padding: 12px 15px; border-bottom: 1px solid #e5e7eb; color: #1f2937;">{html_escape(event.get('date', '-'))}</td>
-                                </tr>
-                                <tr style="background: #f3f4f6;">
-                                    <td style="padding: 12px 15px; border-bottom: 1px solid #e5e7eb; font-weight: 600; color: #374151;">Email</td>
-                                    <td style="padding: 12px 15px; border-bottom: 1px solid #e5e7eb; color: #1f2937;">{html_escape(email)}</td>
-                                </tr>
-                                <tr>
-                                    <td style="padding: 12px 15px; border-bottom: 1px solid #e5e7eb; font-weight: 600; color: #374151;">Registration ID</td>
-                                    <td style="padding: 12px 15px; border-bottom: 1px solid #e5e7eb; color: #1f2937; font-family: monospace; font-size: 12px;">{html_escape(reg.get('registration_id', '-'))}</td>
-                                </tr>
-                                <tr style="background: #f3f4f6;">
-                                    <td style="padding: 12px 15px; border-bottom: 1px solid #e5e7eb; font-weight: 600; color: #374151;">Attendance Status</td>
-                                    <td style="padding: 12px 15px; border-bottom: 1px solid #e5e7eb; color: {status_color}; font-weight: bold;">{status_text}</td>
-                                </tr>
-                                {f'<tr><td style="padding: 12px 15px; border-bottom: 1px solid #e5e7eb; font-weight: 600; color: #374151;">Marked At</td><td style="padding: 12px 15px; border-bottom: 1px solid #e5e7eb; color: #1f2937;">{html_escape(reg.get("entry_time", "-"))}</td></tr>' if reg.get('entry_time') else ''}
-                                {f'<tr style="background: #f3f4f6;"><td style="padding: 12px 15px; border-bottom: 1px solid #e5e7eb; font-weight: 600; color: #374151;">Comment</td><td style="padding: 12px 15px; border-bottom: 1px solid #e5e7eb; color: #f59e0b;">{html_escape(reg.get("attendance_comment", ""))}</td></tr>' if reg.get('attendance_comment') else ''}
-                            </table>
+                                    <!-- Status Badge -->
+                                    <div style="text-align: center; padding: 30px;">
+                                        <div style="display: inline-block; padding: 15px 30px; background: {status_color}20; border-radius: 50px; border: 2px solid {status_color};">
+                                            <span style="font-size: 24px; color: {status_color}; font-weight: bold;">{status_icon} {status_text}</span>
+                                        </div>
+                                    </div>
                             
-                            <!-- Verification Link -->
-                            <div style="background: linear-gradient(135deg, #667eea20, #764ba220); border-radius: 12px; padding: 20px; margin: 20px 0; text-align: center;">
-                                <p style="margin: 0 0 15px; color: #374151; font-weight: 600;">🔗 Shareable Verification Link</p>
-                                <a href="{shareable_link}" style="display: inline-block; background: linear-gradient(135deg, #667eea, #764ba2); color: white; padding: 12px 25px; border-radius: 8px; text-decoration: none; font-weight: 600;">
-                                    View Attendance Proof
-                                </a>
-                                <p style="margin: 15px 0 0; color: #6b7280; font-size: 12px;">
-                                    Share this link with your faculty/college for verification
-                                </p>
-                            </div>
+                                    <!-- Details -->
+                                    <div style="padding: 0 30px 30px;">
+                                        <h3 style="color: #1f2937; margin: 0 0 15px;">Hello {html_escape(participant_name)},</h3>
+                                        <p style="color: #4b5563; line-height: 1.6;">
+                                            Your attendance for <strong>{html_escape(event.get('name', 'the event'))}</strong> has been recorded.
+                                            Below are your details for verification:
+                                        </p>
                             
-                            <!-- QR Code -->
-                            <div style="text-align: center; margin: 30px 0;">
-                                <p style="color: #374151; margin: 0 0 10px; font-weight: 600;">📱 Scan QR to Verify</p>
-                                <img src="cid:qr_code" alt="QR Code" style="width: 150px; height: 150px; border: 2px solid #e5e7eb; border-radius: 8px;">
-                            </div>
-                        </div>
+                                        <table style="width: 100%; border-collapse: collapse; margin: 20px 0;">
+                                            <tr style="background: #f3f4f6;">
+                                                <td style="padding: 12px 15px; border-bottom: 1px solid #e5e7eb; font-weight: 600; color: #374151;">Event</td>
+                                                <td style="padding: 12px 15px; border-bottom: 1px solid #e5e7eb; color: #1f2937;">{html_escape(event.get('name', '-'))}</td>
+                                            </tr>
+                                            <tr>
+                                                <td style="padding: 12px 15px; border-bottom: 1px solid #e5e7eb; font-weight: 600; color: #374151;">Date</td>
+                                                <td style="padding: 12px 15px; border-bottom: 1px solid #e5e7eb; color: #1f2937;">{html_escape(event.get('date', '-'))}</td>
+                                            </tr>
+                                            <tr style="background: #f3f4f6;">
+                                                <td style="padding: 12px 15px; border-bottom: 1px solid #e5e7eb; font-weight: 600; color: #374151;">Email</td>
+                                                <td style="padding: 12px 15px; border-bottom: 1px solid #e5e7eb; color: #1f2937;">{html_escape(email)}</td>
+                                            </tr>
+                                            <tr>
+                                                <td style="padding: 12px 15px; border-bottom: 1px solid #e5e7eb; font-weight: 600; color: #374151;">Registration ID</td>
+                                                <td style="padding: 12px 15px; border-bottom: 1px solid #e5e7eb; color: #1f2937; font-family: monospace; font-size: 12px;">{html_escape(reg.get('registration_id', '-'))}</td>
+                                            </tr>
+                                            <tr style="background: #f3f4f6;">
+                                                <td style="padding: 12px 15px; border-bottom: 1px solid #e5e7eb; font-weight: 600; color: #374151;">Attendance Status</td>
+                                                <td style="padding: 12px 15px; border-bottom: 1px solid #e5e7eb; color: {status_color}; font-weight: bold;">{status_text}</td>
+                                            </tr>
+                                            {f'<tr><td style="padding: 12px 15px; border-bottom: 1px solid #e5e7eb; font-weight: 600; color: #374151;">Marked At</td><td style="padding: 12px 15px; border-bottom: 1px solid #e5e7eb; color: #1f2937;">{html_escape(reg.get("entry_time", "-"))}</td></tr>' if reg.get('entry_time') else ''}
+                                            {f'<tr style="background: #f3f4f6;"><td style="padding: 12px 15px; border-bottom: 1px solid #e5e7eb; font-weight: 600; color: #374151;">Comment</td><td style="padding: 12px 15px; border-bottom: 1px solid #e5e7eb; color: #f59e0b;">{html_escape(reg.get("attendance_comment", ""))}</td></tr>' if reg.get('attendance_comment') else ''}
+                                        </table>
+                            
+                                        <!-- Verification Link -->
+                                        <div style="background: linear-gradient(135deg, #667eea20, #764ba220); border-radius: 12px; padding: 20px; margin: 20px 0; text-align: center;">
+                                            <p style="margin: 0 0 15px; color: #374151; font-weight: 600;">🔗 Shareable Verification Link</p>
+                                            <a href="{shareable_link}" style="display: inline-block; background: linear-gradient(135deg, #667eea, #764ba2); color: white; padding: 12px 25px; border-radius: 8px; text-decoration: none; font-weight: 600;">
+                                                View Attendance Proof
+                                            </a>
+                                            <p style="margin: 15px 0 0; color: #6b7280; font-size: 12px;">
+                                                Share this link with your faculty/college for verification
+                                            </p>
+                                        </div>
+                            
+                                        <!-- QR Code -->
+                                        <div style="text-align: center; margin: 30px 0;">
+                                            <p style="color: #374151; margin: 0 0 10px; font-weight: 600;">📱 Scan QR to Verify</p>
+                                            <img src="cid:qr_code" alt="QR Code" style="width: 150px; height: 150px; border: 2px solid #e5e7eb; border-radius: 8px;">
+                                        </div>
+                                    </div>
+                            
+                                    <!-- Footer -->
+                                    <div style="background: #f3f4f6; padding: 20px; text-align: center; border-top: 1px solid #e5e7eb;">
+                                        <p style="margin: 0; color: #6b7280; font-size: 12px;">
+                                            This is a computer-generated email from {html_escape(snap.club_info.get('name', 'AICC'))}.
+                                        </p>
+                                        <p style="margin: 5px 0 0; color: #9ca3af; font-size: 11px;">
+                                            © {datetime.now().year} {html_escape(snap.club_info.get('short_name', 'AICC'))}. All rights reserved.
+                                        </p>
+                                    </div>
+                                </div>
+                            </body>
+                            </html>
+                            """
+                            
+                            # Create email message
+                            msg = Message(
+                                subject=f"🎓 Attendance Certificate - {event.get('name', 'Event')}",
+                                recipients=[email],
+                                html=email_html
+                            )
+                            
+                            # Attach QR code as inline image
+                            if qr_png:
+                                msg.attach(
+                                    'qr_code.png',
+                                    'image/png',
+                                    qr_png,
+                                    'inline',
+                                    headers={'Content-ID': '<qr_code>'}
+                                )
+                            
+                            conn.send(msg)
+                        except (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError):
+                            raise  # Connection-level failure, handled below
+                        except Exception as e:
+                            logging.error(f"Failed to send attendance email to {reg.get('submitter_email')}: {e}")
+                            pending.popleft()
+                            failed_count += 1
+                            continue
                         
-                        <!-- Footer -->
-                        <div style="background: #f3f4f6; padding: 20px; text-align: center; border-top: 1px solid #e5e7eb;">
-                            <p style="margin: 0; color: #6b7280; font-size: 12px;">
-                                This is a computer-generated email from {html_escape(CLUB_INFO.get('name', 'AICC'))}.
-                            </p>
-                            <p style="margin: 5px 0 0; color: #9ca3af; font-size: 11px;">
-                                © {datetime.now().year} {html_escape(CLUB_INFO.get('short_name', 'AICC'))}. All rights reserved.
-                            </p>
-                        </div>
-                    </div>
-                </body>
-                </html>
-                """
-                
-                # Create email message
-                msg = Message(
-                    subject=f"🎓 Attendance Certificate - {event.get('name', 'Event')}",
-                    recipients=[email],
-                    html=email_html
-                )
-                
-                # Attach QR code as inline image
-                qr_image_data = base64.b64decode(qr_base64)
-                msg.attach(
-                    'qr_code.png',
-                    'image/png',
-                    qr_image_data,
-                    'inline',
-                    headers={'Content-ID': '<qr_code>'}
-                )
-                
-                mail.send(msg)
-                sent_count += 1
-                logging.info(f"Sent attendance email to {email} for event {event_id}")
-                
-            except Exception as e:
-                logging.error(f"Failed to send attendance email to {reg.get('submitter_email')}: {e}")
-                failed_count += 1
+                        pending.popleft()
+                        sent_count += 1
+                        sent_on_connection += 1
+                        logging.info(f"Sent attendance email to {email} for event {event_id}")
+            except (smtplib.SMTPException, OSError) as e:
+                if sent_on_connection:
+                    logging.warning(f"SMTP connection dropped after {sent_on_connection} email(s), reconnecting: {e}")
+                else:
+                    # Connect/login failed, or a fresh connection died straight away: stop here
+                    connection_error = e
+                    logging.error(f"SMTP connection failed in send_attendance_emails: {e}")
+        
+        # Whatever is still queued never went out
+        failed_count += len(pending)
         
         message = f"Sent {sent_count} email(s) successfully."
         if failed_count > 0:
             message += f" {failed_count} failed."
+        if pending and connection_error is not None:
+            message += f" Mail server error: {connection_error}"
         
         return jsonify({
             'success': True,
@@ -3562,10 +4180,9 @@ def admin_send_attendance_emails(event_id):
 @admin_required
 def admin_view_registrations(event_id):
     """View registrations for a specific event"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+    snap = load_data()
     
-    event = next((e for e in EVENTS if e.get('id') == event_id), None)
+    event = get_event_by_id(snap.events, event_id)
     if not event:
         flash('Event not found.', 'error')
         return redirect(url_for('admin_events'))
@@ -3573,12 +4190,9 @@ def admin_view_registrations(event_id):
     # Load form template if assigned
     template = None
     if event.get('template_id'):
-        templates_file = os.path.join(PROJECT_ROOT, 'data', 'form_templates.json')
         try:
-            with open(templates_file, 'r') as f:
-                templates = json.load(f)
-            template = next((t for t in templates if t.get('id') == event.get('template_id')), None)
-        except:
+            template = get_form_templates()[1].get(event.get('template_id'))
+        except Exception:
             pass
     
     # Load registrations for this event
@@ -3586,15 +4200,13 @@ def admin_view_registrations(event_id):
     if event.get('registration_file'):
         reg_file = os.path.join(PROJECT_ROOT, event['registration_file'])
         if os.path.exists(reg_file):
-            with open(reg_file, 'r') as f:
-                registrations = json.load(f)
+            registrations = read_registrations(reg_file)
     else:
         # Fallback to old naming convention for backwards compatibility
         event_slug = slugify(event.get('name', ''))
         reg_file = os.path.join(PROJECT_ROOT, 'data', 'registrations', f'{event_slug}_registrations.json')
         if os.path.exists(reg_file):
-            with open(reg_file, 'r') as f:
-                registrations = json.load(f)
+            registrations = read_registrations(reg_file)
     
     return render_template('admin/view_registrations.html',
                          form=template,
@@ -3605,12 +4217,10 @@ def admin_view_registrations(event_id):
 @admin_required
 def admin_toggle_registration(event_id):
     """Toggle registration open/closed for an event"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
     
     try:
-        events, next_id = load_events_file()
+        events, next_id, event = load_event_for_update(event_id)
         
-        event = next((e for e in events if e.get('id') == event_id), None)
         if not event:
             return jsonify({'success': False, 'message': 'Event not found'}), 404
         
@@ -3620,9 +4230,6 @@ def admin_toggle_registration(event_id):
         
         save_events_file(events, next_id)
         
-        # Reload data
-        CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
-        
         new_status = event['allow_registration']
         return jsonify({
             'success': True, 
@@ -3638,12 +4245,10 @@ def admin_toggle_registration(event_id):
 @admin_required
 def admin_toggle_visibility(event_id):
     """Toggle show_in_events for an event (show/hide from public Events page)"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
     
     try:
-        events, next_id = load_events_file()
+        events, next_id, event = load_event_for_update(event_id)
         
-        event = next((e for e in events if e.get('id') == event_id), None)
         if not event:
             return jsonify({'success': False, 'message': 'Event not found'}), 404
         
@@ -3651,7 +4256,6 @@ def admin_toggle_visibility(event_id):
         event['show_in_events'] = not current
         
         save_events_file(events, next_id)
-        CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
         
         new_status = event['show_in_events']
         return jsonify({
@@ -3682,35 +4286,15 @@ def admin_verify_entry():
         flash('Invalid event ID.', 'error')
         return redirect(url_for('admin_dashboard'))
     
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+    snap = load_data()
     
-    event = next((e for e in EVENTS if e.get('id') == event_id), None)
+    event = get_event_by_id(snap.events, event_id)
     if not event:
         flash('Event not found.', 'error')
         return redirect(url_for('admin_dashboard'))
     
-    # Load registrations
-    registrations = []
-    reg_file_path = None
-    if event.get('registration_file'):
-        reg_file_path = os.path.join(PROJECT_ROOT, event['registration_file'])
-        if os.path.exists(reg_file_path):
-            with open(reg_file_path, 'r') as f:
-                registrations = json.load(f)
-    else:
-        event_slug = slugify(event.get('name', ''))
-        reg_file_path = os.path.join(PROJECT_ROOT, 'data', 'registrations', f'{event_slug}_registrations.json')
-        if os.path.exists(reg_file_path):
-            with open(reg_file_path, 'r') as f:
-                registrations = json.load(f)
-    
-    # Find the registration
-    registration = None
-    for reg in registrations:
-        if reg.get('registration_id') == regid and reg.get('submitter_email', '').lower() == email.lower():
-            registration = reg
-            break
+    # Find the registration through the per-file lookup index
+    registration, _ = find_attendance_registration(event, regid, email.lower())
     
     if not registration:
         flash('Registration not found or email does not match.', 'error')
@@ -3745,10 +4329,9 @@ def admin_mark_entry():
     except (ValueError, TypeError):
         return jsonify({'error': 'Invalid event ID'}), 400
     
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+    snap = load_data()
     
-    event = next((e for e in EVENTS if e.get('id') == event_id), None)
+    event = get_event_by_id(snap.events, event_id)
     if not event:
         return jsonify({'error': 'Event not found'}), 404
     
@@ -3760,58 +4343,52 @@ def admin_mark_entry():
         event_slug = slugify(event.get('name', ''))
         reg_file_path = os.path.join(PROJECT_ROOT, 'data', 'registrations', f'{event_slug}_registrations.json')
     
-    # Load registrations using safe read
-    registrations = safe_json_read(reg_file_path)
-    
-    # Find and update the registration
-    updated = False
-    for reg in registrations:
-        if reg.get('registration_id') == regid and reg.get('submitter_email', '').lower() == email.lower():
+    # Handle participant-based attendance (checkboxes)
+    participant_attendance = None
+    if attendance_type == 'participants' and participant_attendance_json:
+        try:
+            participant_attendance = json.loads(participant_attendance_json)
             
-            # Handle participant-based attendance (checkboxes)
-            if attendance_type == 'participants' and participant_attendance_json:
-                try:
-                    participant_attendance = json.loads(participant_attendance_json)
-                    reg['participant_attendance'] = participant_attendance
-                    
-                    # Calculate overall attendance status
-                    total = len(participant_attendance)
-                    present = sum(1 for p in participant_attendance if p)
-                    
-                    if present == total:
-                        reg['attendance_status'] = 'entered'
-                    elif present > 0:
-                        reg['attendance_status'] = 'partially_present'
-                    else:
-                        reg['attendance_status'] = 'not_entered'
-                    
-                    reg['attendance_comment'] = f'{present}/{total} participants present'
-                    
-                except (json.JSONDecodeError, TypeError) as e:
-                    logger.error(f"Failed to parse participant_attendance: {e}")
-                    return jsonify({'error': 'Invalid participant attendance data'}), 400
+            # Calculate overall attendance status
+            total = len(participant_attendance)
+            present = sum(1 for p in participant_attendance if p)
+        except (json.JSONDecodeError, TypeError) as e:
+            logger.error(f"Failed to parse participant_attendance: {e}")
+            return jsonify({'error': 'Invalid participant attendance data'}), 400
+    
+    marked_by = session.get('admin_username', ADMIN_USERNAME)
+    
+    def mark(reg):
+        if participant_attendance is not None:
+            reg['participant_attendance'] = participant_attendance
+            if present == total:
+                reg['attendance_status'] = 'entered'
+            elif present > 0:
+                reg['attendance_status'] = 'partially_present'
             else:
-                # Legacy mode: full or partial attendance
-                if attendance_type == 'partial':
-                    reg['attendance_status'] = 'partially_present'
-                else:
-                    reg['attendance_status'] = 'entered'
-                reg['attendance_comment'] = attendance_comment
+                reg['attendance_status'] = 'not_entered'
             
-            reg['entry_time'] = datetime.now().isoformat()
-            reg['marked_by'] = session.get('admin_username', ADMIN_USERNAME)
-            updated = True
-            break
-    
-    if not updated:
-        return jsonify({'error': 'Registration not found'}), 404
+            reg['attendance_comment'] = f'{present}/{total} participants present'
+        else:
+            # Legacy mode: full or partial attendance
+            if attendance_type == 'partial':
+                reg['attendance_status'] = 'partially_present'
+            else:
+                reg['attendance_status'] = 'entered'
+            reg['attendance_comment'] = attendance_comment
+        
+        reg['entry_time'] = datetime.now().isoformat()
+        reg['marked_by'] = marked_by
     
-    # Save updated registrations using safe write
+    # Find and update the registration under the file's write lock
     try:
-        safe_json_write(reg_file_path, registrations)
-        return jsonify({'success': True, 'message': 'Entry marked successfully'}), 200
+        updated = update_registration_entry(reg_file_path, regid, email.lower(), mark)
     except Exception as e:
         return jsonify({'error': 'Failed to save entry'}), 500
+    
+    if not updated:
+        return jsonify({'error': 'Registration not found'}), 404
+    return jsonify({'success': True, 'message': 'Entry marked successfully'}), 200
 
 @app.route('/admin/events/<int:event_id>/registrations/export')
 @admin_required
@@ -3826,10 +4403,9 @@ def admin_export_registrations(event_id):
         flash('Please install openpyxl: pip install openpyxl', 'error')
         return redirect(url_for('admin_view_registrations', event_id=event_id))
     
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
+    snap = load_data()
     
-    event = next((e for e in EVENTS if e.get('id') == event_id), None)
+    event = get_event_by_id(snap.events, event_id)
     if not event:
         flash('Event not found.', 'error')
         return redirect(url_for('admin_events'))
@@ -3837,12 +4413,9 @@ def admin_export_registrations(event_id):
     # Load form template if assigned
     template = None
     if event.get('template_id'):
-        templates_file = os.path.join(PROJECT_ROOT, 'data', 'form_templates.json')
         try:
-            with open(templates_file, 'r') as f:
-                templates = json.load(f)
-            template = next((t for t in templates if t.get('id') == event.get('template_id')), None)
-        except:
+            template = get_form_templates()[1].get(event.get('template_id'))
+        except Exception:
             pass
     
     if not template:
@@ -3854,15 +4427,13 @@ def admin_export_registrations(event_id):
     if event.get('registration_file'):
         reg_file = os.path.join(PROJECT_ROOT, event['registration_file'])
         if os.path.exists(reg_file):
-            with open(reg_file, 'r') as f:
-                registrations = json.load(f)
+            registrations = read_registrations(reg_file)
     else:
         # Fallback to old naming convention for backwards compatibility
         event_slug = slugify(event.get('name', ''))
         reg_file = os.path.join(PROJECT_ROOT, 'data', 'registrations', f'{event_slug}_registrations.json')
         if os.path.exists(reg_file):
-            with open(reg_file, 'r') as f:
-                registrations = json.load(f)
+            registrations = read_registrations(reg_file)
     
     if not registrations:
         flash('No registrations to export.', 'error')
@@ -3944,9 +4515,8 @@ def admin_export_registrations(event_id):
 @app.errorhandler(404)
 def page_not_found(e):
     """Custom 404 error page"""
-    global CLUB_INFO, EVENTS, MEMBERS, GALLERY
-    CLUB_INFO, EVENTS, MEMBERS, GALLERY = load_data()
-    return render_template('404.html', club_info=CLUB_INFO, contact=CLUB_INFO), 404
+    snap = load_data()
+    return render_template('404.html', club_info=snap.club_info, contact=snap.club_info), 404
 
 if __name__ == '__main__':
     app.run(debug=True, host='0.0.0.0', port=5000)